@@ -71,8 +71,8 @@ def load_settings():
     if not os.path.exists(SETTINGS_FILE):
         return {}
     try:
-        with open(SETTINGS_FILE, 'r') as f:
-            return json.load(f)
+        with open(SETTINGS_FILE, 'rb') as f:
+            return json.loads(f.read())
     except Exception as e:
         logger.error(f"Failed to load settings: {e}")
         return {}
@@ -86,8 +86,8 @@ def save_settings(key, value):
     settings[key] = value
     
     try:
-        with open(SETTINGS_FILE, 'w') as f:
-            json.dump(settings, f, indent=4)
+        with open(SETTINGS_FILE, 'wb') as f:
+            f.write(json.dumps(settings, indent=4).encode('utf-8'))
         logger.info(f"Saved setting: {key} = {value}")
     except Exception as e:
         logger.error(f"Failed to save settings: {e}")
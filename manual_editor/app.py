@@ -16,6 +16,7 @@ This module is completely independent from the AI automation pipeline.
 
 import sys
 import os
+from pathlib import Path
 
 # Ensure the parent directory is in path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -58,47 +59,9 @@ def launch_manual_editor():
     palette.setColor(QPalette.HighlightedText, Qt.black)
     app.setPalette(palette)
     
-    # Apply global stylesheet
-    app.setStyleSheet("""
-        QToolTip {
-            color: #ffffff;
-            background-color: #2d2d2d;
-            border: 1px solid #444;
-            padding: 4px;
-        }
-        QScrollBar:vertical {
-            background: #2d2d2d;
-            width: 12px;
-            margin: 0;
-        }
-        QScrollBar::handle:vertical {
-            background: #555;
-            min-height: 20px;
-            border-radius: 6px;
-        }
-        QScrollBar::handle:vertical:hover {
-            background: #666;
-        }
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-            height: 0;
-        }
-        QScrollBar:horizontal {
-            background: #2d2d2d;
-            height: 12px;
-            margin: 0;
-        }
-        QScrollBar::handle:horizontal {
-            background: #555;
-            min-width: 20px;
-            border-radius: 6px;
-        }
-        QScrollBar::handle:horizontal:hover {
-            background: #666;
-        }
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-            width: 0;
-        }
-    """)
+    # Apply the application theme (parsed once for all widgets)
+    theme_path = Path(__file__).parent / "resources" / "theme.qss"
+    app.setStyleSheet(theme_path.read_text(encoding="utf-8"))
     
     # Import and create main window
     from manual_editor.ui.main_window import MainWindow
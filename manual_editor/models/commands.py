@@ -166,6 +166,39 @@ class CommandHistory:
         self._redo_stack.clear()
 
 
+class CompoundCommand(Command):
+    """
+    Several commands applied, undone and redone as one history step
+    (e.g. moving every clip of a multi-selection drag).
+    """
+    
+    def __init__(self, commands: List[Command], description: str):
+        self._commands = commands
+        self._description = description
+    
+    def execute(self) -> bool:
+        for i, command in enumerate(self._commands):
+            if not command.execute():
+                # All or nothing: roll back the ones already applied
+                for done in reversed(self._commands[:i]):
+                    done.undo()
+                return False
+        return True
+    
+    def undo(self) -> bool:
+        for i, command in enumerate(reversed(self._commands)):
+            if not command.undo():
+                # Re-apply the ones already undone
+                for undone in self._commands[len(self._commands) - i:]:
+                    undone.execute()
+                return False
+        return True
+    
+    @property
+    def description(self) -> str:
+        return self._description
+
+
 # ============================================================================
 # Clip Commands
 # ============================================================================
@@ -215,6 +215,8 @@ class Subtitle:
         start_time: When the subtitle appears on timeline (seconds)
         duration: How long the subtitle is visible (seconds)
         style: Font styling options
+        revision: Bumped whenever text/timing changes (not serialized),
+            lets views cache derived strings
     """
     id: str
     text: str
@@ -229,6 +231,12 @@ class Subtitle:
         "position": "bottom",  # top, center, bottom
         "alignment": "center"  # left, center, right
     })
+    revision: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in ("text", "start_time", "duration"):
+            object.__setattr__(self, "revision", self.revision + 1)
     
     @property
     def end_time(self) -> float:
@@ -13,18 +13,25 @@ Architecture:
     ├── Frame buffer (pre-decoded frames)
     ├── Playback timer (QTimer)
     └── Position tracking
+    
+    FramePrefetcher (QThread)
+    └── Sliding-window frame cache around the playhead
+    
+    ThumbnailLadder (QThread)
+    └── 1-per-second low-res thumbnails for scrubbing
 """
 
 import os
 import subprocess
 import tempfile
 import threading
+from collections import OrderedDict
 from typing import Optional, Callable, List, Tuple
 from dataclasses import dataclass
 from queue import Queue, Empty
 
-from PySide6.QtCore import QObject, Signal, QTimer
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, Signal, QTimer, QThread, QCoreApplication
+from PySide6.QtGui import QImage
 
 # Local imports
 import sys
@@ -45,7 +52,12 @@ class FrameDecoder:
     Decodes video frames using FFmpeg.
     
     Uses a subprocess to pipe raw RGB data, which is then
-    converted to QImage for display.
+    converted to QImage for display. Frames are read straight into
+    the pixel memory of the QImage handed to callers, so there is no
+    per-frame copy. Only widths whose rows Qt pads (width * 3 not a
+    multiple of 4) go through a reused buffer and one copy.
+    
+    Not thread-safe: use one decoder per thread.
     """
     
     def __init__(self, video_path: str, width: int = 640, height: int = 360):
@@ -65,6 +77,10 @@ class FrameDecoder:
             self.height = self.height - (self.height % 2)
         except Exception:
             pass
+        
+        self._frame_size = self.width * self.height * 3
+        self._frame_buf = bytearray(self._frame_size)
+        self._frame_view = memoryview(self._frame_buf)
     
     def decode_frame(self, time_seconds: float) -> Optional[QImage]:
         """
@@ -90,32 +106,57 @@ class FrameDecoder:
         ]
         
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
-                timeout=5.0,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
                 creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
             )
-            
-            if result.returncode == 0 and result.stdout:
-                # Convert raw RGB to QImage
-                expected_size = self.width * self.height * 3
-                if len(result.stdout) >= expected_size:
-                    image = QImage(
-                        result.stdout[:expected_size],
-                        self.width,
-                        self.height,
-                        self.width * 3,
-                        QImage.Format_RGB888
-                    )
-                    return image.copy()  # Make a copy since buffer will be freed
-            
-        except subprocess.TimeoutExpired:
-            pass
+        except Exception:
+            return None
+        
+        # Kill a stuck decode so the read below hits EOF
+        killer = threading.Timer(5.0, process.kill)
+        killer.start()
+        
+        # The image owns its pixels, so it stays valid after being cached,
+        # emitted across threads or outliving this decoder
+        image = QImage(self.width, self.height, QImage.Format_RGB888)
+        if image.bytesPerLine() == self.width * 3:
+            target = image.bits()
+        else:
+            image = None
+            target = self._frame_view
+        
+        filled = 0
+        try:
+            while filled < self._frame_size:
+                n = process.stdout.readinto(target[filled:])
+                if not n:
+                    break
+                filled += n
         except Exception:
             pass
+        finally:
+            killer.cancel()
+            process.stdout.close()
+            process.wait()
+        
+        if filled < self._frame_size:
+            return None
+        if image is not None:
+            return image
         
-        return None
+        # Padded rows: convert raw RGB to QImage
+        image = QImage(
+            self._frame_buf,
+            self.width,
+            self.height,
+            self.width * 3,
+            QImage.Format_RGB888
+        )
+        return image.copy()  # Detach from the reused buffer
     
     @property
     def duration(self) -> float:
@@ -140,13 +181,13 @@ class PlaybackEngine(QObject):
     Emits signals for UI updates.
     
     Signals:
-        frame_ready: Emitted when a new frame is ready (QPixmap)
+        frame_ready: Emitted when a new frame is ready (QImage, seek token)
         position_changed: Emitted when playback position changes (seconds)
         playback_finished: Emitted when playback reaches end
         state_changed: Emitted when play/pause state changes (is_playing)
     """
     
-    frame_ready = Signal(QPixmap)
+    frame_ready = Signal(QImage, int)
     position_changed = Signal(float)
     playback_finished = Signal()
     state_changed = Signal(bool)
@@ -159,6 +200,9 @@ class PlaybackEngine(QObject):
         self._current_time = 0.0
         self._duration = 0.0
         
+        # Bumped on every seek; frames carry the token they were decoded for
+        self._seek_token = 0
+        
         # Current source
         self._current_source: Optional[str] = None
         self._decoder: Optional[FrameDecoder] = None
@@ -235,24 +279,33 @@ class PlaybackEngine(QObject):
         if self._decoder:
             self._decode_and_emit_current_frame()
     
-    def seek(self, time_seconds: float) -> None:
+    def seek(self, time_seconds: float, decode: bool = True) -> None:
         """
         Seek to a specific time position.
         
         Args:
             time_seconds: Target time in seconds
+            decode: If False, only move the position (the caller
+                already has the frame, e.g. from a FramePrefetcher)
         """
         if not self._decoder:
             return
         
+        self._seek_token += 1
         self._current_time = max(0, min(time_seconds, self._duration))
         self.position_changed.emit(self._current_time)
-        self._decode_and_emit_current_frame()
+        if decode:
+            self._decode_and_emit_current_frame()
     
     def seek_relative(self, delta_seconds: float) -> None:
         """Seek relative to current position."""
         self.seek(self._current_time + delta_seconds)
     
+    @property
+    def seek_token(self) -> int:
+        """Token of the latest seek (frames with older tokens are stale)."""
+        return self._seek_token
+    
     @property
     def is_playing(self) -> bool:
         """Whether playback is currently active."""
@@ -290,18 +343,18 @@ class PlaybackEngine(QObject):
         if not self._decoder:
             return
         
+        token = self._seek_token
+        
         # Check cache first
         cache_key = f"{self._current_source}:{self._current_time:.2f}"
         if cache_key in self._frame_cache:
-            pixmap = self._frame_cache[cache_key]
-            self.frame_ready.emit(pixmap)
+            image = self._frame_cache[cache_key]
+            self.frame_ready.emit(image, token)
             return
         
         # Decode frame
         image = self._decoder.decode_frame(self._current_time)
         if image:
-            pixmap = QPixmap.fromImage(image)
-            
             # Add to cache
             if len(self._frame_cache) >= self._cache_max_size:
                 # Remove oldest entries
@@ -309,5 +362,249 @@ class PlaybackEngine(QObject):
                 for key in keys[:10]:
                     del self._frame_cache[key]
             
-            self._frame_cache[cache_key] = pixmap
-            self.frame_ready.emit(pixmap)
+            self._frame_cache[cache_key] = image
+            self.frame_ready.emit(image, token)
+
+
+class FramePrefetcher(QThread):
+    """
+    Background decoder that caches frames around the playhead.
+    
+    After each request(t) the thread decodes frames at t ± n/fps,
+    interleaving directions so that front_back_ratio of the window
+    lies ahead of the playhead. Frames are keyed by frame index and
+    the cache is bounded by both frame count and total bytes.
+    
+    A newer request abandons the current walk, so the window always
+    follows the latest position.
+    """
+    
+    def __init__(
+        self,
+        max_frames: int = 240,
+        max_bytes: int = 128 * 1024 * 1024,
+        front_back_ratio: float = 0.75,
+        parent=None
+    ):
+        super().__init__(parent)
+        
+        self._max_frames = max_frames
+        self._max_bytes = max_bytes
+        self._front_back_ratio = front_back_ratio
+        
+        self._cache: "OrderedDict[int, QImage]" = OrderedDict()
+        self._cache_bytes = 0
+        self._fps = 30.0
+        
+        # Shared state (guarded by _lock)
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._source: Optional[str] = None
+        self._center: Optional[float] = None
+        self._generation = 0
+        self._running = True
+        
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop)
+    
+    def set_source(self, video_path: str) -> None:
+        """Switch source and invalidate the cache."""
+        with self._wake:
+            self._source = video_path
+            self._center = None
+            self._generation += 1
+            self._cache.clear()
+            self._cache_bytes = 0
+        
+        if not self.isRunning():
+            self.start(QThread.LowPriority)
+    
+    def request(self, time_seconds: float) -> None:
+        """Re-center the prefetch window on a new position."""
+        with self._wake:
+            self._center = time_seconds
+            self._generation += 1
+            self._wake.notify()
+    
+    def lookup(self, time_seconds: float) -> Optional[QImage]:
+        """Get a cached frame for a position, or None."""
+        with self._lock:
+            key = self._frame_key(time_seconds)
+            image = self._cache.get(key)
+            if image is not None:
+                self._cache.move_to_end(key)
+            return image
+    
+    def stop(self) -> None:
+        """Stop the prefetch thread."""
+        with self._wake:
+            self._running = False
+            self._generation += 1
+            self._wake.notify()
+        self.wait()
+    
+    def run(self) -> None:
+        decoder: Optional[FrameDecoder] = None
+        
+        while True:
+            with self._wake:
+                while self._running and self._center is None:
+                    self._wake.wait()
+                if not self._running:
+                    return
+                center = self._center
+                source = self._source
+                generation = self._generation
+                self._center = None
+            
+            if source is None:
+                continue
+            if decoder is None or decoder.video_path != source:
+                decoder = FrameDecoder(source)
+                with self._lock:
+                    self._fps = decoder.fps or 30.0
+            
+            for t in self._window_times(center, decoder.fps or 30.0, decoder.duration):
+                with self._lock:
+                    if self._generation != generation:
+                        break
+                    key = self._frame_key(t)
+                    if key in self._cache:
+                        continue
+                
+                image = decoder.decode_frame(t)
+                if image is None:
+                    continue
+                
+                with self._lock:
+                    if self._generation != generation:
+                        break
+                    self._store(key, image)
+    
+    def _window_times(self, center: float, fps: float, duration: float) -> List[float]:
+        """Times to prefetch, nearest first, weighted by front_back_ratio."""
+        ratio = min(max(self._front_back_ratio, 0.01), 0.99)
+        ahead = int(self._max_frames * ratio)
+        behind = self._max_frames - ahead
+        
+        # Order by offset scaled by direction weight
+        offsets = [(i / ratio, i) for i in range(1, ahead + 1)]
+        offsets += [(i / (1 - ratio), -i) for i in range(1, behind + 1)]
+        offsets.sort()
+        
+        times = []
+        for _, n in offsets:
+            t = center + n / fps
+            if 0 <= t <= duration:
+                times.append(t)
+        return times
+    
+    def _frame_key(self, time_seconds: float) -> int:
+        return round(time_seconds * self._fps)
+    
+    def _store(self, key: int, image: QImage) -> None:
+        """Add a frame, evicting least recently used frames past the limits."""
+        self._cache[key] = image
+        self._cache_bytes += image.sizeInBytes()
+        
+        while self._cache and (
+            len(self._cache) > self._max_frames or self._cache_bytes > self._max_bytes
+        ):
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= evicted.sizeInBytes()
+
+
+class ThumbnailLadder(QThread):
+    """
+    Background generator of low-resolution scrub thumbnails.
+    
+    A single FFmpeg pass (fps=1, scaled down) streams one thumbnail
+    per second of video into a dict keyed by whole second, so a
+    slider drag can show an approximate frame instantly while the
+    full-resolution decode is deferred.
+    """
+    
+    def __init__(self, width: int = 160, parent=None):
+        super().__init__(parent)
+        
+        self._width = width
+        self._source: Optional[str] = None
+        self._thumbs: dict = {}  # second -> QImage
+        self._process: Optional[subprocess.Popen] = None
+        self._cancelled = False
+        
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.stop)
+    
+    def set_source(self, video_path: str) -> None:
+        """Discard current thumbnails and start generating for a new source."""
+        self.stop()
+        self._source = video_path
+        self._thumbs = {}
+        self._cancelled = False
+        self.start(QThread.LowPriority)
+    
+    def thumbnail(self, time_seconds: float) -> Optional[QImage]:
+        """Get the thumbnail for the second containing a position, or None."""
+        return self._thumbs.get(int(time_seconds))
+    
+    def stop(self) -> None:
+        """Cancel generation and wait for the thread to finish."""
+        self._cancelled = True
+        process = self._process
+        if process and process.poll() is None:
+            process.kill()
+        self.wait()
+    
+    def run(self) -> None:
+        try:
+            metadata = get_video_metadata(self._source)
+            aspect = metadata.width / metadata.height
+        except Exception:
+            return
+        
+        width = self._width - (self._width % 2)
+        height = int(width / aspect)
+        height = height - (height % 2)
+        frame_size = width * height * 3
+        
+        cmd = [
+            get_ffmpeg_path(),
+            "-nostats", "-loglevel", "error",
+            "-i", self._source,
+            "-an", "-sn",
+            "-vf", f"fps=1,scale={width}:{height}",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-"
+        ]
+        
+        try:
+            self._process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+            )
+        except Exception:
+            return
+        
+        thumbs = self._thumbs
+        second = 0
+        try:
+            while not self._cancelled:
+                data = self._process.stdout.read(frame_size)
+                if len(data) < frame_size:
+                    break
+                thumbs[second] = QImage(
+                    data, width, height, width * 3, QImage.Format_RGB888
+                ).copy()
+                second += 1
+        finally:
+            if self._process.poll() is None:
+                self._process.kill()
+            self._process.stdout.close()
+            self._process.wait()
+            self._process = None
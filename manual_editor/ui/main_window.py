@@ -25,9 +25,9 @@ from PySide6.QtGui import QAction, QKeySequence, QCloseEvent, QIcon
 # Local imports
 from manual_editor.models.project import Project, Clip, AudioClip, Subtitle
 from manual_editor.models.commands import (
-    CommandHistory, AddClipCommand, DeleteClipCommand,
-    MoveClipCommand, SplitClipCommand, AddSubtitleCommand,
-    DeleteSubtitleCommand, EditSubtitleCommand
+    CommandHistory, CompoundCommand, AddClipCommand, DeleteClipCommand,
+    MoveClipCommand, MoveAudioClipCommand, SplitClipCommand,
+    AddSubtitleCommand, DeleteSubtitleCommand, EditSubtitleCommand
 )
 from manual_editor.ui.timeline_widget import TimelineWidget
 from manual_editor.ui.preview_widget import PreviewWidget
@@ -83,49 +83,6 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("LazyCut Manual Editor - Untitled")
         self.setMinimumSize(1200, 700)
         self.resize(1400, 850)
-        
-        # Dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: #fff;
-                padding: 4px;
-            }
-            QMenuBar::item:selected {
-                background-color: #4285f4;
-            }
-            QMenu {
-                background-color: #2d2d2d;
-                color: #fff;
-                border: 1px solid #444;
-            }
-            QMenu::item:selected {
-                background-color: #4285f4;
-            }
-            QToolBar {
-                background-color: #2d2d2d;
-                border: none;
-                spacing: 3px;
-                padding: 3px;
-            }
-            QStatusBar {
-                background-color: #2d2d2d;
-                color: #999;
-            }
-            QSplitter::handle {
-                background-color: #444;
-            }
-            QDockWidget {
-                color: #fff;
-            }
-            QDockWidget::title {
-                background-color: #2d2d2d;
-                padding: 6px;
-            }
-        """)
     
     def _setup_menu_bar(self) -> None:
         """Create menu bar with all menus and actions."""
@@ -152,6 +109,9 @@ class MainWindow(QMainWindow):
         self.action_save_as.setShortcut(QKeySequence("Ctrl+Shift+S"))
         self.action_save_as.triggered.connect(self._on_save_project_as)
         
+        self.action_export_readable = file_menu.addAction("Export Readable Copy...")
+        self.action_export_readable.triggered.connect(self._on_export_readable_copy)
+        
         file_menu.addSeparator()
         
         self.action_import = file_menu.addAction("Import Media...")
@@ -310,6 +270,7 @@ class MainWindow(QMainWindow):
         """Connect component signals."""
         # Timeline signals
         self.timeline.time_changed.connect(self._on_timeline_time_changed)
+        self.timeline.clips_moved.connect(self._on_clips_moved)
         self.timeline.clip_deleted.connect(self._on_clip_delete_requested)
         self.timeline.clip_split_requested.connect(self._on_clip_split_requested)
         
@@ -419,6 +380,20 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save project:\n{e}")
     
+    def _on_export_readable_copy(self) -> None:
+        """Save an indented copy of the project for inspection (doesn't change the current file)."""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Readable Copy",
+            f"{self.project.name}.json",
+            "JSON (*.json)"
+        )
+        
+        if file_path:
+            if save_project(self.project, file_path, pretty=True):
+                self.status_label.setText(f"Exported: {os.path.basename(file_path)}")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to export readable copy.")
+    
     def _on_import_media(self) -> None:
         """Import media files."""
         files, _ = QFileDialog.getOpenFileNames(
@@ -571,6 +546,25 @@ class MainWindow(QMainWindow):
                 self._mark_unsaved()
                 self.status_label.setText("Clip split at playhead")
     
+    def _on_clips_moved(self, moves: list) -> None:
+        """Handle clips dragged to new timeline positions, as one undo step."""
+        commands = [
+            MoveClipCommand(self.project, clip_id, new_start)
+            if self.project.get_clip_by_id(clip_id)
+            else MoveAudioClipCommand(self.project, clip_id, new_start)
+            for clip_id, new_start in moves
+        ]
+        if len(commands) == 1:
+            cmd = commands[0]
+        else:
+            cmd = CompoundCommand(commands, f"Move {len(commands)} clips")
+        
+        if self.command_history.execute(cmd):
+            self.timeline.refresh()
+            self._mark_unsaved()
+            self.status_label.setText("Clip moved" if len(commands) == 1 else "Clips moved")
+            self._update_undo_redo_state()
+    
     def _on_clip_delete_requested(self, clip_id: str) -> None:
         """Handle clip deletion request."""
         cmd = DeleteClipCommand(self.project, clip_id)
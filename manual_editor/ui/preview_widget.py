@@ -10,10 +10,75 @@ from PySide6.QtWidgets import (
     QPushButton, QSlider, QStyle, QSizePolicy,
     QFrame
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QSize, QTimer
 from PySide6.QtGui import QPixmap, QImage, QPalette, QColor
+import bisect
+from collections import OrderedDict
+from time import perf_counter
+from typing import Optional, Tuple, List
 
-from manual_editor.playback.engine import PlaybackEngine
+from manual_editor.playback.engine import PlaybackEngine, FramePrefetcher, ThumbnailLadder
+from shared.ffmpeg_utils import get_keyframe_times
+
+
+# Pre-baked "MM:SS" labels for the first hour
+MMSS_STRINGS = tuple(f"{m:02d}:{s:02d}" for m in range(60) for s in range(60))
+
+# Number of scaled frames kept for re-display (scrubbing back and forth)
+SCALED_CACHE_SIZE = 16
+
+# Frames within this window after a seek are scaled with FastTransformation
+SCRUB_WINDOW = 0.1
+
+# Idle delay before a fast-scaled frame is redone with SmoothTransformation
+SMOOTH_RESCALE_DELAY_MS = 120
+
+# Debounce for decoding a (keyframe-snapped) frame during a slider drag
+DRAG_SEEK_DELAY_MS = 50
+
+
+class _ScaleSignals(QObject):
+    """Signals for ScaleWorker (QRunnable cannot emit signals itself)."""
+    finished = Signal(QImage)
+
+
+class ScaleWorker(QRunnable):
+    """
+    Scales a decoded frame on a thread pool thread.
+    
+    Works on QImage rather than QPixmap since QPixmap may only be
+    used on the GUI thread. The result is delivered via signals.finished.
+    """
+    
+    def __init__(self, image: QImage, size: QSize, mode: Qt.TransformationMode):
+        super().__init__()
+        
+        self.image = image
+        self.size = size
+        self.mode = mode
+        self.signals = _ScaleSignals()
+    
+    def run(self) -> None:
+        scaled = self.image.scaled(self.size, Qt.KeepAspectRatio, self.mode)
+        self.signals.finished.emit(scaled)
+
+
+class _KeyframeSignals(QObject):
+    """Signals for KeyframeIndexWorker."""
+    finished = Signal(str, list)  # video_path, keyframe times
+
+
+class KeyframeIndexWorker(QRunnable):
+    """Builds the keyframe index of a video off the GUI thread."""
+    
+    def __init__(self, video_path: str):
+        super().__init__()
+        
+        self.video_path = video_path
+        self.signals = _KeyframeSignals()
+    
+    def run(self) -> None:
+        self.signals.finished.emit(self.video_path, get_keyframe_times(self.video_path))
 
 
 class PreviewWidget(QWidget):
@@ -36,8 +101,47 @@ class PreviewWidget(QWidget):
         super().__init__(parent)
         
         self.engine = PlaybackEngine(self)
+        self._prefetcher = FramePrefetcher(parent=self)
+        self._thumbnails = ThumbnailLadder(parent=self)
         self._duration = 0.0
         self._is_seeking = False
+        self._last_shown_sec = -1
+        self._last_slider_value = -1
+        
+        # Off-thread frame scaling (one job in flight, newest frame wins)
+        self._scale_pool = QThreadPool(self)
+        self._scale_pool.setMaxThreadCount(1)
+        self._scale_in_flight = False
+        self._scale_signals: Optional[_ScaleSignals] = None
+        self._pending_frame: Optional[QImage] = None
+        self._scaling_key: Optional[Tuple[int, int, int]] = None
+        self._scaling_smooth = True
+        self._scaling_token = 0
+        self._pending_token = 0
+        self._seek_token = 0  # token of the newest frame accepted for display
+        
+        # Scaled frames keyed by (source cacheKey, width, height)
+        self._scaled_cache: "OrderedDict[Tuple[int, int, int], QImage]" = OrderedDict()
+        
+        # Fast scaling while scrubbing, smooth re-scale once idle
+        self._last_seek_ts = 0.0
+        self._last_source: Optional[QImage] = None
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(SMOOTH_RESCALE_DELAY_MS)
+        self._smooth_timer.timeout.connect(self._on_smooth_rescale)
+        
+        # Debounced decode while dragging the seek slider
+        self._drag_target = 0.0
+        self._drag_seek_timer = QTimer(self)
+        self._drag_seek_timer.setSingleShot(True)
+        self._drag_seek_timer.setInterval(DRAG_SEEK_DELAY_MS)
+        self._drag_seek_timer.timeout.connect(self._on_drag_seek_timeout)
+        
+        # Sorted keyframe times of the current source (filled in background)
+        self._source_path: Optional[str] = None
+        self._kf_times: List[float] = []
+        self._kf_signals: Optional[_KeyframeSignals] = None
         
         self._setup_ui()
         self._connect_signals()
@@ -50,12 +154,7 @@ class PreviewWidget(QWidget):
         
         # Video display area
         self.video_frame = QFrame()
-        self.video_frame.setStyleSheet("""
-            QFrame {
-                background-color: #1a1a1a;
-                border: 1px solid #333;
-            }
-        """)
+        self.video_frame.setObjectName("previewVideoFrame")
         self.video_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
         video_layout = QVBoxLayout(self.video_frame)
@@ -64,7 +163,7 @@ class PreviewWidget(QWidget):
         self.video_label = QLabel()
         self.video_label.setAlignment(Qt.AlignCenter)
         self.video_label.setMinimumSize(320, 180)
-        self.video_label.setStyleSheet("background-color: #000;")
+        self.video_label.setObjectName("previewVideoLabel")
         self.video_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         video_layout.addWidget(self.video_label)
         
@@ -73,12 +172,7 @@ class PreviewWidget(QWidget):
         # Controls area
         controls_frame = QFrame()
         controls_frame.setFixedHeight(80)
-        controls_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2d2d2d;
-                border-top: 1px solid #444;
-            }
-        """)
+        controls_frame.setObjectName("previewControls")
         
         controls_layout = QVBoxLayout(controls_frame)
         controls_layout.setContentsMargins(10, 5, 10, 5)
@@ -88,23 +182,7 @@ class PreviewWidget(QWidget):
         self.seek_slider = QSlider(Qt.Horizontal)
         self.seek_slider.setRange(0, 1000)
         self.seek_slider.setValue(0)
-        self.seek_slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                background: #444;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #4285f4;
-                width: 14px;
-                margin: -4px 0;
-                border-radius: 7px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4285f4;
-                border-radius: 3px;
-            }
-        """)
+        self.seek_slider.setObjectName("previewSeekSlider")
         controls_layout.addWidget(self.seek_slider)
         
         # Transport controls
@@ -113,68 +191,46 @@ class PreviewWidget(QWidget):
         
         # Time display (current)
         self.time_current = QLabel("00:00")
-        self.time_current.setStyleSheet("color: #fff; font-family: monospace; font-size: 12px;")
+        self.time_current.setProperty("class", "timecode")
         transport_layout.addWidget(self.time_current)
         
         transport_layout.addStretch()
         
         # Transport buttons
-        btn_style = """
-            QPushButton {
-                background-color: #3d3d3d;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #2d2d2d;
-            }
-        """
         
         # Rewind button
         self.btn_rewind = QPushButton("⏮")
         self.btn_rewind.setFixedSize(36, 36)
-        self.btn_rewind.setStyleSheet(btn_style)
+        self.btn_rewind.setProperty("class", "transportButton")
         self.btn_rewind.clicked.connect(self._on_rewind)
         transport_layout.addWidget(self.btn_rewind)
         
         # Step back button
         self.btn_step_back = QPushButton("◀")
         self.btn_step_back.setFixedSize(36, 36)
-        self.btn_step_back.setStyleSheet(btn_style)
-        self.btn_step_back.clicked.connect(lambda: self.engine.seek_relative(-1.0))
+        self.btn_step_back.setProperty("class", "transportButton")
+        self.btn_step_back.clicked.connect(self._on_step_back)
         transport_layout.addWidget(self.btn_step_back)
         
         # Play/Pause button
         self.btn_play = QPushButton("▶")
         self.btn_play.setFixedSize(48, 36)
-        self.btn_play.setStyleSheet(btn_style + """
-            QPushButton {
-                background-color: #4285f4;
-            }
-            QPushButton:hover {
-                background-color: #5294f5;
-            }
-        """)
+        self.btn_play.setObjectName("previewPlayButton")
+        self.btn_play.setProperty("class", "transportButton")
         self.btn_play.clicked.connect(self._on_play_clicked)
         transport_layout.addWidget(self.btn_play)
         
         # Step forward button
         self.btn_step_forward = QPushButton("▶")
         self.btn_step_forward.setFixedSize(36, 36)
-        self.btn_step_forward.setStyleSheet(btn_style)
-        self.btn_step_forward.clicked.connect(lambda: self.engine.seek_relative(1.0))
+        self.btn_step_forward.setProperty("class", "transportButton")
+        self.btn_step_forward.clicked.connect(self._on_step_forward)
         transport_layout.addWidget(self.btn_step_forward)
         
         # Forward button
         self.btn_forward = QPushButton("⏭")
         self.btn_forward.setFixedSize(36, 36)
-        self.btn_forward.setStyleSheet(btn_style)
+        self.btn_forward.setProperty("class", "transportButton")
         self.btn_forward.clicked.connect(self._on_forward)
         transport_layout.addWidget(self.btn_forward)
         
@@ -182,7 +238,8 @@ class PreviewWidget(QWidget):
         
         # Time display (total)
         self.time_total = QLabel("00:00")
-        self.time_total.setStyleSheet("color: #888; font-family: monospace; font-size: 12px;")
+        self.time_total.setObjectName("previewTimeTotal")
+        self.time_total.setProperty("class", "timecode")
         transport_layout.addWidget(self.time_total)
         
         controls_layout.addLayout(transport_layout)
@@ -201,41 +258,165 @@ class PreviewWidget(QWidget):
     
     def set_source(self, video_path: str) -> bool:
         """Set the video source for preview."""
+        # Forget what the old clip showed, or the new clip's first position
+        # updates would be skipped as unchanged
+        self._last_shown_sec = -1
+        self._last_slider_value = -1
         success = self.engine.set_source(video_path)
         if success:
             self._duration = self.engine.duration
             self.time_total.setText(self._format_time(self._duration))
+            self._prefetcher.set_source(video_path)
+            self._thumbnails.set_source(video_path)
+            self._start_keyframe_index(video_path)
         return success
     
+    def nearest_kf(self, time_seconds: float, direction: int = -1) -> float:
+        """
+        Get the nearest keyframe time to a position.
+        
+        Args:
+            time_seconds: Position in seconds
+            direction: -1 for the keyframe at or before the position,
+                +1 for the keyframe at or after it
+            
+        Returns:
+            Keyframe time, or time_seconds if the index is not ready
+        """
+        kf = self._kf_times
+        if not kf:
+            return time_seconds
+        
+        if direction < 0:
+            idx = bisect.bisect_right(kf, time_seconds) - 1
+            return kf[max(idx, 0)]
+        
+        idx = bisect.bisect_left(kf, time_seconds)
+        return kf[min(idx, len(kf) - 1)]
+    
+    def _start_keyframe_index(self, video_path: str) -> None:
+        """Build the keyframe index for a new source in the background."""
+        self._source_path = video_path
+        self._kf_times = []
+        
+        worker = KeyframeIndexWorker(video_path)
+        worker.signals.finished.connect(self._on_keyframe_index_ready)
+        self._kf_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+    
+    @Slot(str, list)
+    def _on_keyframe_index_ready(self, video_path: str, times: list) -> None:
+        """Store the keyframe index if it belongs to the current source."""
+        if video_path == self._source_path:
+            self._kf_times = times
+            self._kf_signals = None
+    
     def seek(self, time_seconds: float) -> None:
-        """Seek to a specific time."""
-        self.engine.seek(time_seconds)
+        """Seek to a specific time, using a prefetched frame if available."""
+        self._last_seek_ts = perf_counter()
+        cached = self._prefetcher.lookup(time_seconds)
+        if cached is not None:
+            self.engine.seek(time_seconds, decode=False)
+            self._on_frame_ready(cached, self.engine.seek_token)
+        else:
+            self.engine.seek(time_seconds)
     
-    @Slot(QPixmap)
-    def _on_frame_ready(self, pixmap: QPixmap) -> None:
+    @Slot(QImage, int)
+    def _on_frame_ready(self, image: QImage, token: int) -> None:
         """Handle new frame from engine."""
-        if pixmap.isNull():
+        # Frames decoded for a seek the user has already moved past are stale
+        if image.isNull() or token != self.engine.seek_token:
+            return
+        
+        self._seek_token = token
+        self._last_source = image
+        size = self.video_label.size()
+        key = (image.cacheKey(), size.width(), size.height())
+        cached = self._scaled_cache.get(key)
+        if cached is not None:
+            self._scaled_cache.move_to_end(key)
+            self._pending_frame = None
+            self.video_label.setPixmap(QPixmap.fromImage(cached))
+            return
+        
+        if self._scale_in_flight:
+            # Drop any older pending frame - only the newest matters
+            self._pending_frame = image
+            self._pending_token = token
+            return
+        
+        self._start_scale(image, token)
+    
+    def _start_scale(self, image: QImage, token: int) -> None:
+        """Dispatch a frame to the scale worker."""
+        self._scale_in_flight = True
+        self._scaling_token = token
+        
+        # Cheap bilinear scaling while scrubbing; redo smoothly once idle
+        scrubbing = self._is_seeking or perf_counter() - self._last_seek_ts < SCRUB_WINDOW
+        if scrubbing:
+            mode = Qt.FastTransformation
+            self._smooth_timer.start()
+        else:
+            mode = Qt.SmoothTransformation
+        self._scaling_smooth = not scrubbing
+        
+        # Scale to fit label while maintaining aspect ratio
+        size = self.video_label.size()
+        self._scaling_key = (image.cacheKey(), size.width(), size.height())
+        worker = ScaleWorker(image, size, mode)
+        worker.signals.finished.connect(self._on_frame_scaled)
+        self._scale_signals = worker.signals
+        self._scale_pool.start(worker)
+    
+    @Slot(QImage)
+    def _on_frame_scaled(self, scaled: QImage) -> None:
+        """Display a scaled frame (GUI thread)."""
+        self._scale_in_flight = False
+        self._scale_signals = None
+        
+        # Only smooth results are worth re-displaying later
+        if self._scaling_smooth:
+            self._scaled_cache[self._scaling_key] = scaled
+            if len(self._scaled_cache) > SCALED_CACHE_SIZE:
+                self._scaled_cache.popitem(last=False)
+        
+        if self._scaling_token == self.engine.seek_token:
+            self.video_label.setPixmap(QPixmap.fromImage(scaled))
+        
+        if self._pending_frame is not None:
+            image, self._pending_frame = self._pending_frame, None
+            if self._pending_token == self.engine.seek_token:
+                self._start_scale(image, self._pending_token)
+    
+    @Slot()
+    def _on_smooth_rescale(self) -> None:
+        """Re-scale the last frame with SmoothTransformation once scrubbing stops."""
+        if self._is_seeking:
+            self._smooth_timer.start()
             return
         
-        # Scale pixmap to fit label while maintaining aspect ratio
-        scaled = pixmap.scaled(
-            self.video_label.size(),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-        self.video_label.setPixmap(scaled)
+        if self._last_source is not None and self._pending_frame is None:
+            self._on_frame_ready(self._last_source, self._seek_token)
     
     @Slot(float)
     def _on_position_changed(self, seconds: float) -> None:
         """Handle position update from engine."""
-        self.time_current.setText(self._format_time(seconds))
+        # Label only changes once per second - skip redundant repaints
+        isec = int(seconds)
+        if isec != self._last_shown_sec:
+            self._last_shown_sec = isec
+            self.time_current.setText(self._format_time(seconds))
         
         if not self._is_seeking and self._duration > 0:
             slider_value = int((seconds / self._duration) * 1000)
-            self.seek_slider.blockSignals(True)
-            self.seek_slider.setValue(slider_value)
-            self.seek_slider.blockSignals(False)
+            if slider_value != self._last_slider_value:
+                self._last_slider_value = slider_value
+                self.seek_slider.blockSignals(True)
+                self.seek_slider.setValue(slider_value)
+                self.seek_slider.blockSignals(False)
         
+        self._prefetcher.request(seconds)
         self.position_changed.emit(seconds)
     
     @Slot(bool)
@@ -260,6 +441,16 @@ class PreviewWidget(QWidget):
         """Go to end."""
         self.engine.seek(self._duration)
     
+    @Slot()
+    def _on_step_back(self) -> None:
+        """Step back one second."""
+        self.engine.seek_relative(-1.0)
+    
+    @Slot()
+    def _on_step_forward(self) -> None:
+        """Step forward one second."""
+        self.engine.seek_relative(1.0)
+    
     def _on_slider_pressed(self) -> None:
         """Handle slider press - pause for seeking."""
         self._is_seeking = True
@@ -269,17 +460,61 @@ class PreviewWidget(QWidget):
     def _on_slider_released(self) -> None:
         """Handle slider release - resume if was playing."""
         self._is_seeking = False
+        self._last_slider_value = -1
+        self._drag_seek_timer.stop()
+        
+        # The drag showed thumbnails/keyframes only - land on the exact frame
+        if self._duration > 0:
+            self.seek((self.seek_slider.value() / 1000.0) * self._duration)
+        
         if self._was_playing:
             self.engine.play()
     
     def _on_slider_moved(self, value: int) -> None:
-        """Handle slider drag."""
-        if self._duration > 0:
-            time = (value / 1000.0) * self._duration
-            self.engine.seek(time)
+        """
+        Handle slider drag.
+        
+        Every move only updates the position and shows a thumbnail;
+        a real decode (snapped to the nearest keyframe) runs once the
+        drag pauses for DRAG_SEEK_DELAY_MS, and the exact frame is
+        decoded on release.
+        """
+        if self._duration <= 0:
+            return
+        
+        time = (value / 1000.0) * self._duration
+        self._last_seek_ts = perf_counter()
+        
+        if not self._is_seeking:
+            self.seek(time)
+            return
+        
+        # Position-only seek: updates the time label and invalidates
+        # frames still in flight for earlier positions
+        self.engine.seek(time, decode=False)
+        thumb = self._thumbnails.thumbnail(time)
+        if thumb is not None:
+            self._show_thumbnail(thumb)
+        
+        self._drag_target = time
+        self._drag_seek_timer.start()
+    
+    @Slot()
+    def _on_drag_seek_timeout(self) -> None:
+        """Decode the keyframe nearest the drag position."""
+        if self._is_seeking:
+            self.seek(self.nearest_kf(self._drag_target))
+    
+    def _show_thumbnail(self, thumb: QImage) -> None:
+        """Display a scrub thumbnail scaled up to the label."""
+        self._pending_frame = None
+        scaled = thumb.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.video_label.setPixmap(QPixmap.fromImage(scaled))
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds as MM:SS."""
+        if 0 <= seconds < 3600:
+            return MMSS_STRINGS[int(seconds)]
         minutes = int(seconds // 60)
         secs = int(seconds % 60)
         return f"{minutes:02d}:{secs:02d}"
@@ -4,19 +4,160 @@ Subtitle Editor Widget
 Panel for adding and editing subtitles manually.
 """
 
+import bisect
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QLineEdit, QDoubleSpinBox, QListWidget,
-    QListWidgetItem, QFrame, QTextEdit, QSplitter,
+    QPushButton, QLineEdit, QDoubleSpinBox, QListView,
+    QFrame, QTextEdit, QSplitter,
     QGroupBox, QFormLayout, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
-from typing import Optional, TYPE_CHECKING
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex
+from typing import Optional, List, Dict, Tuple, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from manual_editor.models.project import Project, Subtitle
 
 
+def _format_time(seconds: float) -> str:
+    """Format seconds as MM:SS."""
+    minutes = int(seconds // 60)
+    secs = int(seconds % 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+class SubtitleListModel(QAbstractListModel):
+    """
+    List model backing the subtitle list.
+    
+    Rows are kept sorted by start time, with a parallel list of start
+    times for bisect lookups. Single add/update/delete operations are
+    applied in place (insert, dataChanged, move, remove) so an edit
+    never re-sorts or rebuilds the whole list.
+    
+    Roles:
+        DisplayRole: Formatted "[mm:ss - mm:ss] text" label
+        UserRole: Subtitle id
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        self._keys: List[float] = []  # start times, parallel to _rows
+        self._rows: List["Subtitle"] = []
+        
+        # id -> (subtitle, revision, label), so unchanged rows are never
+        # re-formatted. Revisions restart at 0 for every Subtitle object, so
+        # the entry also holds the object it was built from: a reloaded
+        # subtitle with the same id and revision must not reuse it
+        self._label_cache: Dict[str, Tuple["Subtitle", int, str]] = {}
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        
+        sub = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self._label_for(sub)
+        if role == Qt.UserRole:
+            return sub.id
+        return None
+    
+    def set_subtitles(self, subtitles: Iterable["Subtitle"]) -> None:
+        """Replace all rows with a single model reset."""
+        self.beginResetModel()
+        self._rows = sorted(subtitles, key=lambda s: s.start_time)
+        self._keys = [s.start_time for s in self._rows]
+        
+        # Drop labels of subtitles that no longer exist
+        ids = {s.id for s in self._rows}
+        self._label_cache = {k: v for k, v in self._label_cache.items() if k in ids}
+        self.endResetModel()
+    
+    def add_subtitle(self, subtitle: "Subtitle") -> None:
+        """Insert a subtitle at its sorted position."""
+        row = bisect.bisect_right(self._keys, subtitle.start_time)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._keys.insert(row, subtitle.start_time)
+        self._rows.insert(row, subtitle)
+        self.endInsertRows()
+    
+    def update_subtitle(self, subtitle_id: str) -> None:
+        """Refresh a single row after its subtitle was edited."""
+        row = self.row_of(subtitle_id)
+        if row < 0:
+            return
+        
+        subtitle = self._rows[row]
+        key = subtitle.start_time
+        
+        if row > 0 and self._keys[row - 1] > key:
+            # Moved earlier: destination is within rows before this one
+            dest = bisect.bisect_right(self._keys, key, 0, row)
+            new_row = dest
+        elif row < len(self._keys) - 1 and self._keys[row + 1] < key:
+            # Moved later: Qt's destination counts the row being moved
+            dest = bisect.bisect_right(self._keys, key, row + 1)
+            new_row = dest - 1
+        else:
+            self._keys[row] = key
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+            return
+        
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), dest)
+        del self._keys[row]
+        del self._rows[row]
+        self._keys.insert(new_row, key)
+        self._rows.insert(new_row, subtitle)
+        self.endMoveRows()
+        
+        index = self.index(new_row, 0)
+        self.dataChanged.emit(index, index)
+    
+    def remove_subtitle(self, subtitle_id: str) -> None:
+        """Remove the row for a subtitle."""
+        row = self.row_of(subtitle_id)
+        if row >= 0:
+            self._remove_row(row)
+    
+    def row_of(self, subtitle_id: str) -> int:
+        """Get the row of a subtitle, or -1 if not present."""
+        for row, sub in enumerate(self._rows):
+            if sub.id == subtitle_id:
+                return row
+        return -1
+    
+    def _remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._label_cache.pop(self._rows[row].id, None)
+        del self._keys[row]
+        del self._rows[row]
+        self.endRemoveRows()
+    
+    def _label_for(self, sub: "Subtitle") -> str:
+        """Get the cached label for a subtitle, rebuilding it if stale."""
+        cached = self._label_cache.get(sub.id)
+        if cached is not None and cached[0] is sub and cached[1] == sub.revision:
+            return cached[2]
+        
+        label = self._format_label(sub)
+        self._label_cache[sub.id] = (sub, sub.revision, label)
+        return label
+    
+    @staticmethod
+    def _format_label(sub: "Subtitle") -> str:
+        """Build the list label, e.g. [00:05 - 00:08] "Hello world"."""
+        start = _format_time(sub.start_time)
+        end = _format_time(sub.start_time + sub.duration)
+        text_preview = sub.text[:30] + "..." if len(sub.text) > 30 else sub.text
+        return f"[{start} - {end}] \"{text_preview}\""
+
+
 class SubtitleEditor(QWidget):
     """
     Subtitle editing panel.
@@ -56,50 +197,24 @@ class SubtitleEditor(QWidget):
         
         # Header
         header = QLabel("📝 Subtitles")
-        header.setStyleSheet("""
-            font-size: 14px;
-            font-weight: bold;
-            color: #fff;
-            padding: 5px;
-        """)
+        header.setObjectName("subtitleHeader")
         layout.addWidget(header)
         
         # Editor group
         editor_group = QGroupBox("Edit Subtitle")
-        editor_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #444;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #fff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-        """)
+        editor_group.setObjectName("subtitleEditorGroup")
         
         editor_layout = QVBoxLayout(editor_group)
         
         # Text input
         text_label = QLabel("Text:")
-        text_label.setStyleSheet("color: #ccc;")
+        text_label.setProperty("class", "fieldLabel")
         editor_layout.addWidget(text_label)
         
         self.text_input = QTextEdit()
         self.text_input.setMaximumHeight(80)
         self.text_input.setPlaceholderText("Enter subtitle text...")
-        self.text_input.setStyleSheet("""
-            QTextEdit {
-                background-color: #333;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }
-        """)
+        self.text_input.setObjectName("subtitleTextInput")
         editor_layout.addWidget(self.text_input)
         
         # Time controls
@@ -108,29 +223,21 @@ class SubtitleEditor(QWidget):
         # Start time
         start_frame = QVBoxLayout()
         start_label = QLabel("Start (sec):")
-        start_label.setStyleSheet("color: #ccc; font-size: 11px;")
+        start_label.setProperty("class", "fieldCaption")
         start_frame.addWidget(start_label)
         
         self.start_spin = QDoubleSpinBox()
         self.start_spin.setRange(0, 36000)  # Up to 10 hours
         self.start_spin.setDecimals(2)
         self.start_spin.setSingleStep(0.1)
-        self.start_spin.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #333;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }
-        """)
+        self.start_spin.setProperty("class", "timeSpin")
         start_frame.addWidget(self.start_spin)
         time_layout.addLayout(start_frame)
         
         # Duration
         duration_frame = QVBoxLayout()
         duration_label = QLabel("Duration (sec):")
-        duration_label.setStyleSheet("color: #ccc; font-size: 11px;")
+        duration_label.setProperty("class", "fieldCaption")
         duration_frame.addWidget(duration_label)
         
         self.duration_spin = QDoubleSpinBox()
@@ -138,15 +245,7 @@ class SubtitleEditor(QWidget):
         self.duration_spin.setDecimals(2)
         self.duration_spin.setSingleStep(0.1)
         self.duration_spin.setValue(3.0)
-        self.duration_spin.setStyleSheet("""
-            QDoubleSpinBox {
-                background-color: #333;
-                color: #fff;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }
-        """)
+        self.duration_spin.setProperty("class", "timeSpin")
         duration_frame.addWidget(self.duration_spin)
         time_layout.addLayout(duration_frame)
         
@@ -154,76 +253,27 @@ class SubtitleEditor(QWidget):
         
         # Use current time button
         self.btn_use_current = QPushButton("📍 Use Playhead Time")
-        self.btn_use_current.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #fff;
-                border: none;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        self.btn_use_current.setObjectName("subtitleUseCurrentButton")
         editor_layout.addWidget(self.btn_use_current)
         
         # Action buttons
         btn_layout = QHBoxLayout()
         
         self.btn_add = QPushButton("➕ Add")
-        self.btn_add.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #5CBF60;
-            }
-        """)
+        self.btn_add.setObjectName("subtitleAddButton")
+        self.btn_add.setProperty("class", "actionButton")
         btn_layout.addWidget(self.btn_add)
         
         self.btn_update = QPushButton("✏️ Update")
         self.btn_update.setEnabled(False)
-        self.btn_update.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #42A6F3;
-            }
-            QPushButton:disabled {
-                background-color: #555;
-                color: #888;
-            }
-        """)
+        self.btn_update.setObjectName("subtitleUpdateButton")
+        self.btn_update.setProperty("class", "actionButton")
         btn_layout.addWidget(self.btn_update)
         
         self.btn_delete = QPushButton("🗑️ Delete")
         self.btn_delete.setEnabled(False)
-        self.btn_delete.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #f55346;
-            }
-            QPushButton:disabled {
-                background-color: #555;
-                color: #888;
-            }
-        """)
+        self.btn_delete.setObjectName("subtitleDeleteButton")
+        self.btn_delete.setProperty("class", "actionButton")
         btn_layout.addWidget(self.btn_delete)
         
         editor_layout.addLayout(btn_layout)
@@ -231,44 +281,24 @@ class SubtitleEditor(QWidget):
         
         # Subtitle list
         list_label = QLabel("Subtitle List:")
-        list_label.setStyleSheet("color: #ccc; margin-top: 10px;")
+        list_label.setObjectName("subtitleListLabel")
+        list_label.setProperty("class", "fieldLabel")
         layout.addWidget(list_label)
         
-        self.subtitle_list = QListWidget()
-        self.subtitle_list.setStyleSheet("""
-            QListWidget {
-                background-color: #2d2d2d;
-                color: #fff;
-                border: 1px solid #444;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #333;
-            }
-            QListWidget::item:selected {
-                background-color: #4285f4;
-            }
-            QListWidget::item:hover {
-                background-color: #3d3d3d;
-            }
-        """)
+        self._list_model = SubtitleListModel(self)
+        self.subtitle_list = QListView()
+        self.subtitle_list.setModel(self._list_model)
+        # Rows are single-line labels - skip per-row size hints and lay out
+        # large lists in batches
+        self.subtitle_list.setUniformItemSizes(True)
+        self.subtitle_list.setLayoutMode(QListView.Batched)
+        self.subtitle_list.setBatchSize(200)
+        self.subtitle_list.setObjectName("subtitleList")
         layout.addWidget(self.subtitle_list, stretch=1)
         
         # Clear button
         self.btn_clear = QPushButton("Clear Selection")
-        self.btn_clear.setStyleSheet("""
-            QPushButton {
-                background-color: #3d3d3d;
-                color: #ccc;
-                border: none;
-                border-radius: 4px;
-                padding: 6px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-        """)
+        self.btn_clear.setObjectName("subtitleClearButton")
         layout.addWidget(self.btn_clear)
     
     def _connect_signals(self) -> None:
@@ -277,8 +307,8 @@ class SubtitleEditor(QWidget):
         self.btn_update.clicked.connect(self._on_update_clicked)
         self.btn_delete.clicked.connect(self._on_delete_clicked)
         self.btn_clear.clicked.connect(self._clear_selection)
-        self.subtitle_list.itemClicked.connect(self._on_item_clicked)
-        self.subtitle_list.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.subtitle_list.clicked.connect(self._on_item_clicked)
+        self.subtitle_list.doubleClicked.connect(self._on_item_double_clicked)
     
     def set_project(self, project: "Project") -> None:
         """Set the project and refresh the list."""
@@ -290,30 +320,8 @@ class SubtitleEditor(QWidget):
         self.start_spin.setValue(time_seconds)
     
     def refresh_list(self) -> None:
-        """Refresh the subtitle list from the project."""
-        self.subtitle_list.clear()
-        
-        if not self.project:
-            return
-        
-        # Sort subtitles by start time
-        subtitles = sorted(self.project.subtitles, key=lambda s: s.start_time)
-        
-        for sub in subtitles:
-            # Format: [00:05 - 00:08] "Hello world"
-            start = self._format_time(sub.start_time)
-            end = self._format_time(sub.start_time + sub.duration)
-            text_preview = sub.text[:30] + "..." if len(sub.text) > 30 else sub.text
-            
-            item = QListWidgetItem(f"[{start} - {end}] \"{text_preview}\"")
-            item.setData(Qt.UserRole, sub.id)
-            self.subtitle_list.addItem(item)
-    
-    def _format_time(self, seconds: float) -> str:
-        """Format seconds as MM:SS."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes:02d}:{secs:02d}"
+        """Rebuild the subtitle list from the project (single model reset)."""
+        self._list_model.set_subtitles(self.project.subtitles if self.project else [])
     
     def _on_add_clicked(self) -> None:
         """Handle add button click."""
@@ -334,7 +342,8 @@ class SubtitleEditor(QWidget):
         
         # Clear form
         self.text_input.clear()
-        self.refresh_list()
+        if self.project and self.project.get_subtitle_by_id(subtitle.id):
+            self._list_model.add_subtitle(subtitle)
     
     def _on_update_clicked(self) -> None:
         """Handle update button click."""
@@ -353,7 +362,7 @@ class SubtitleEditor(QWidget):
             self.duration_spin.value()
         )
         
-        self.refresh_list()
+        self._list_model.update_subtitle(self._current_subtitle_id)
     
     def _on_delete_clicked(self) -> None:
         """Handle delete button click."""
@@ -368,13 +377,15 @@ class SubtitleEditor(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            self.subtitle_deleted.emit(self._current_subtitle_id)
+            subtitle_id = self._current_subtitle_id
+            self.subtitle_deleted.emit(subtitle_id)
             self._clear_selection()
-            self.refresh_list()
+            if not (self.project and self.project.get_subtitle_by_id(subtitle_id)):
+                self._list_model.remove_subtitle(subtitle_id)
     
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_clicked(self, index: QModelIndex) -> None:
         """Handle subtitle item selection."""
-        subtitle_id = item.data(Qt.UserRole)
+        subtitle_id = index.data(Qt.UserRole)
         self._current_subtitle_id = subtitle_id
         
         # Enable edit buttons
@@ -391,9 +402,9 @@ class SubtitleEditor(QWidget):
         
         self.subtitle_selected.emit(subtitle_id)
     
-    def _on_item_double_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_double_clicked(self, index: QModelIndex) -> None:
         """Handle double-click to seek to subtitle time."""
-        subtitle_id = item.data(Qt.UserRole)
+        subtitle_id = index.data(Qt.UserRole)
         if self.project:
             subtitle = self.project.get_subtitle_by_id(subtitle_id)
             if subtitle:
@@ -15,6 +15,17 @@ Architecture:
     └── Controls (zoom slider, etc.)
 """
 
+import math
+from contextlib import contextmanager
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, 
     QGraphicsScene, QGraphicsRectItem, QGraphicsLineItem,
@@ -22,13 +33,13 @@ from PySide6.QtWidgets import (
     QGraphicsItem, QMenu, QScrollBar
 )
 from PySide6.QtCore import (
-    Qt, Signal, QRectF, QPointF, QLineF, QTimer
+    Qt, Signal, QRectF, QPointF, QLineF, QTimer, QSettings
 )
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QBrush, QFont, QWheelEvent,
-    QMouseEvent, QKeyEvent, QTransform
+    QMouseEvent, QKeyEvent, QTransform, QFontMetricsF
 )
-from typing import Optional, List, Dict, TYPE_CHECKING
+from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from manual_editor.models.project import Project, Clip, AudioClip
@@ -54,8 +65,71 @@ COLOR_VIDEO_CLIP = QColor(66, 133, 244)  # Blue
 COLOR_VIDEO_CLIP_SELECTED = QColor(100, 160, 255)
 COLOR_AUDIO_CLIP = QColor(52, 168, 83)   # Green
 COLOR_AUDIO_CLIP_SELECTED = QColor(80, 200, 110)
+COLOR_VIDEO_CLIP_BORDER = COLOR_VIDEO_CLIP.darker(110)
+COLOR_VIDEO_CLIP_BORDER_SEL = COLOR_VIDEO_CLIP_SELECTED.lighter(130)
+COLOR_AUDIO_CLIP_BORDER = COLOR_AUDIO_CLIP.darker(110)
+COLOR_AUDIO_CLIP_BORDER_SEL = COLOR_AUDIO_CLIP_SELECTED.lighter(130)
+COLOR_AUDIO_TRACK_BG = COLOR_TRACK_BG.darker(110)
 COLOR_PLAYHEAD = QColor(255, 80, 80)     # Red
 COLOR_SELECTION = QColor(255, 255, 255, 50)
+COLOR_TRIM_HANDLE = QColor(255, 255, 255, 100)
+
+
+def _make_pen(color: QColor, width: int = 1) -> QPen:
+    pen = QPen(color)
+    pen.setWidth(width)
+    return pen
+
+
+# Shared pens/brushes (re-creating these per paint is expensive)
+NO_PEN = QPen(Qt.NoPen)
+BRUSH_RULER = QBrush(COLOR_RULER)
+BRUSH_TRACK_HEADER = QBrush(COLOR_TRACK_HEADER)
+BRUSH_TRACK_BG_VIDEO = QBrush(COLOR_TRACK_BG)
+BRUSH_TRACK_BG_AUDIO = QBrush(COLOR_AUDIO_TRACK_BG)
+BRUSH_TRIM_HANDLE = QBrush(COLOR_TRIM_HANDLE)
+PEN_RULER_TEXT = QPen(COLOR_RULER_TEXT)
+PEN_PLAYHEAD = _make_pen(COLOR_PLAYHEAD, 2)
+PEN_CLIP_TEXT = QPen(Qt.white)
+
+# Clip (brush, pen) keyed by (is_audio, is_selected)
+CLIP_STYLES = {
+    (False, False): (QBrush(COLOR_VIDEO_CLIP), _make_pen(COLOR_VIDEO_CLIP_BORDER)),
+    (False, True): (QBrush(COLOR_VIDEO_CLIP_SELECTED), _make_pen(COLOR_VIDEO_CLIP_BORDER_SEL, 2)),
+    (True, False): (QBrush(COLOR_AUDIO_CLIP), _make_pen(COLOR_AUDIO_CLIP_BORDER)),
+    (True, True): (QBrush(COLOR_AUDIO_CLIP_SELECTED), _make_pen(COLOR_AUDIO_CLIP_BORDER_SEL, 2)),
+}
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Shared font (created lazily, as fonts need a QGuiApplication)."""
+    return QFont("Arial", point_size, QFont.Bold if bold else QFont.Normal)
+
+
+@lru_cache(maxsize=None)
+def _clip_font_metrics() -> QFontMetricsF:
+    """Metrics of the clip label font, used for eliding clip names."""
+    return QFontMetricsF(_font(9))
+
+
+def _generate_ticks(first, last, pps, minor_interval, minor_per_major):
+    """
+    Tick geometry for tick indices first..last.
+    
+    Returns:
+        (major_xs, minor_xs, major_times) as numpy arrays
+    """
+    n = np.arange(first, last + 1, dtype=np.int64)
+    times = n * minor_interval
+    xs = (times * pps).astype(np.int32)
+    is_major = n % minor_per_major == 0
+    return xs[is_major], xs[~is_major], times[is_major]
+
+
+def _vertical_lines(xs: np.ndarray, y0: float, y1: float) -> List[QLineF]:
+    """Build vertical lines at xs from y0 to y1, for a single drawLines() call."""
+    return [QLineF(x, y0, x, y1) for x in xs.tolist()]
 
 
 class TimelineClipItem(QGraphicsRectItem):
@@ -96,37 +170,37 @@ class TimelineClipItem(QGraphicsRectItem):
         # Enable interactions
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
-        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges, True)
+        # No ItemSendsGeometryChanges: nothing overrides itemChange, and a
+        # drag is reported once on release through clips_moved
         self.setAcceptHoverEvents(True)
         
+        # Reuse the rasterized clip while panning/scrubbing; setRect() and
+        # _update_appearance() call update(), which regenerates the cache
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
         # Set appearance
         self._update_appearance()
         
-        # Add name label
-        self._label = QGraphicsTextItem(self)
-        self._label.setPlainText(self._truncate_name(name, width))
-        self._label.setDefaultTextColor(Qt.white)
-        font = QFont("Arial", 9)
-        self._label.setFont(font)
-        self._label.setPos(x + 4, y + 2)
+        # Name label is painted directly; elided text is cached per width
+        self._label_text = ""
+        self._label_width = -1.0
+    
+    def set_geometry(self, x: float, y: float, width: float, height: float, name: str) -> None:
+        """Move/resize the clip in place (e.g. after a zoom change)."""
+        self.setPos(0, 0)  # Drop any uncommitted drag offset
+        self.setRect(x, y, width, height)
+        if name != self.clip_name:
+            self.clip_name = name
+            self._label_width = -1.0
     
     def _truncate_name(self, name: str, width: float) -> str:
-        """Truncate name to fit in clip rectangle."""
-        max_chars = int(width / 7)  # Approximate character width
-        if len(name) > max_chars and max_chars > 3:
-            return name[:max_chars - 3] + "..."
-        return name if len(name) <= max_chars else ""
+        """Elide name to fit in clip rectangle (minus label padding)."""
+        return _clip_font_metrics().elidedText(name, Qt.ElideRight, max(0.0, width - 8))
     
     def _update_appearance(self) -> None:
         """Update visual appearance based on state."""
-        if self.is_audio:
-            color = COLOR_AUDIO_CLIP_SELECTED if self._is_selected else COLOR_AUDIO_CLIP
-        else:
-            color = COLOR_VIDEO_CLIP_SELECTED if self._is_selected else COLOR_VIDEO_CLIP
-        
-        self.setBrush(QBrush(color))
-        pen = QPen(color.lighter(130) if self._is_selected else color.darker(110))
-        pen.setWidth(2 if self._is_selected else 1)
+        brush, pen = CLIP_STYLES[(self.is_audio, self._is_selected)]
+        self.setBrush(brush)
         self.setPen(pen)
     
     def setSelected(self, selected: bool) -> None:
@@ -142,8 +216,7 @@ class TimelineClipItem(QGraphicsRectItem):
         # Draw trim handles when selected
         if self._is_selected:
             rect = self.rect()
-            handle_color = QColor(255, 255, 255, 100)
-            painter.setBrush(QBrush(handle_color))
+            painter.setBrush(BRUSH_TRIM_HANDLE)
             painter.setPen(Qt.NoPen)
             
             # Left handle
@@ -158,6 +231,21 @@ class TimelineClipItem(QGraphicsRectItem):
                 rect.y(),
                 self._trim_handle_width, rect.height()
             )
+        
+        # Name label
+        rect = self.rect()
+        if rect.width() != self._label_width:
+            self._label_text = self._truncate_name(self.clip_name, rect.width())
+            self._label_width = rect.width()
+        
+        if self._label_text:
+            painter.setFont(_font(9))
+            painter.setPen(PEN_CLIP_TEXT)
+            painter.drawText(
+                QRectF(rect.x() + 4, rect.y() + 2, rect.width() - 8, 16),
+                Qt.AlignLeft | Qt.AlignVCenter | Qt.TextSingleLine,
+                self._label_text
+            )
     
     def hoverMoveEvent(self, event):
         """Change cursor based on position for trim handles."""
@@ -215,11 +303,44 @@ class TimelineClipItem(QGraphicsRectItem):
             super().mouseMoveEvent(event)
     
     def mouseReleaseEvent(self, event):
-        """Clean up after drag/trim."""
+        """Clean up after drag/trim and report a completed move."""
+        was_dragging = (
+            self._drag_start_x is not None
+            and not self._is_trimming_left
+            and not self._is_trimming_right
+        )
         self._is_trimming_left = False
         self._is_trimming_right = False
         self._drag_start_x = None
         super().mouseReleaseEvent(event)
+        
+        if was_dragging and self.scene():
+            view = self.scene().views()[0]
+            
+            # Qt drags every selected clip along with this one. Drop all the
+            # drag offsets before reporting: the project update re-lays out
+            # moved clips, and refresh_timeline() skips unchanged ones, which
+            # would otherwise keep a stale offset (e.g. after a vertical drag)
+            dragged = [
+                item for item in self.scene().selectedItems()
+                if isinstance(item, TimelineClipItem)
+            ]
+            if self not in dragged:
+                dragged.append(self)
+            
+            moves = []
+            for item in dragged:
+                offset = item.pos().x()
+                item.setPos(0, 0)
+                if offset != 0:
+                    new_x = item.rect().x() + offset
+                    moves.append((
+                        item.clip_id,
+                        max(0.0, (new_x - TRACK_HEADER_WIDTH) / view.pixels_per_second)
+                    ))
+            
+            if moves:
+                view.clips_moved.emit(moves)
     
     def contextMenuEvent(self, event):
         """Show context menu."""
@@ -252,9 +373,7 @@ class PlayheadItem(QGraphicsLineItem):
         self._height = height
         
         # Appearance
-        pen = QPen(COLOR_PLAYHEAD)
-        pen.setWidth(2)
-        self.setPen(pen)
+        self.setPen(PEN_PLAYHEAD)
         
         # Make draggable
         self.setFlag(QGraphicsItem.ItemIsMovable, True)
@@ -285,6 +404,11 @@ class PlayheadItem(QGraphicsLineItem):
 class TimelineRuler(QGraphicsRectItem):
     """
     The time ruler showing time markers and labels.
+    
+    Tick marks are built into two line lists (minor/major) for the
+    exposed range only, so paint() issues two drawLines calls instead of
+    one drawLine per tick across the whole timeline. The lists are
+    reused while the zoom level and exposed range stay the same.
     """
     
     def __init__(self, width: float, height: float, pixels_per_second: float):
@@ -293,46 +417,77 @@ class TimelineRuler(QGraphicsRectItem):
         self.pixels_per_second = pixels_per_second
         self._width = width
         
-        self.setBrush(QBrush(COLOR_RULER))
-        self.setPen(QPen(Qt.NoPen))
+        # Cached tick geometry, valid for _ticks_key == (pps, first, last)
+        self._ticks_key: Optional[Tuple[float, int, int]] = None
+        self._minor_lines: List[QLineF] = []
+        self._major_lines: List[QLineF] = []
+        self._major_labels: List[Tuple[int, str]] = []
+        
+        self.setBrush(BRUSH_RULER)
+        self.setPen(NO_PEN)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        
+        # Needed for an accurate option.exposedRect in paint()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
     
     def paint(self, painter, option, widget=None):
         """Custom paint to draw time markers."""
         super().paint(painter, option, widget)
         
-        painter.setPen(QPen(COLOR_RULER_TEXT))
-        font = QFont("Arial", 8)
-        painter.setFont(font)
+        # Only generate ticks for the exposed slice, starting ~one label
+        # width early so labels of ticks just left of it still draw
+        _, minor_interval = self._tick_intervals()
+        step = minor_interval * self.pixels_per_second
+        exposed = option.exposedRect
+        last_tick = math.ceil(self._width / step) - 1
+        first = max(0, math.floor((exposed.left() - 60) / step))
+        last = min(last_tick, math.ceil(exposed.right() / step))
+        
+        if self._ticks_key != (self.pixels_per_second, first, last):
+            self._build_ticks(first, last)
         
-        # Determine tick interval based on zoom level
+        painter.setPen(PEN_RULER_TEXT)
+        painter.setBrush(Qt.NoBrush)
+        painter.setFont(_font(8))
+        
+        # An empty list can't pick between the drawLines overloads
+        if self._minor_lines:
+            painter.drawLines(self._minor_lines)
+        if self._major_lines:
+            painter.drawLines(self._major_lines)
+        
+        label_y = int(RULER_HEIGHT - 18)
+        for x, label in self._major_labels:
+            painter.drawText(x + 3, label_y, label)
+    
+    def _tick_intervals(self) -> Tuple[float, float]:
+        """Get (major, minor) tick intervals in seconds for the zoom level."""
         if self.pixels_per_second >= 100:
-            major_interval = 1  # Every second
-            minor_interval = 0.1
+            return 1, 0.1  # Every second
         elif self.pixels_per_second >= 30:
-            major_interval = 5  # Every 5 seconds
-            minor_interval = 1
+            return 5, 1  # Every 5 seconds
         elif self.pixels_per_second >= 10:
-            major_interval = 10  # Every 10 seconds
-            minor_interval = 5
-        else:
-            major_interval = 30  # Every 30 seconds
-            minor_interval = 10
+            return 10, 5  # Every 10 seconds
+        return 30, 10  # Every 30 seconds
+    
+    def _build_ticks(self, first: int, last: int) -> None:
+        """Rebuild the tick lines and label positions for tick indices first..last."""
+        major_interval, minor_interval = self._tick_intervals()
+        minor_per_major = round(major_interval / minor_interval)
+        pps = self.pixels_per_second
         
-        # Draw ticks
-        time = 0
-        while time * self.pixels_per_second < self._width:
-            x = time * self.pixels_per_second
-            
-            if time % major_interval == 0:
-                # Major tick with label
-                painter.drawLine(int(x), int(RULER_HEIGHT - 15), int(x), int(RULER_HEIGHT))
-                label = self._format_time(time)
-                painter.drawText(int(x + 3), int(RULER_HEIGHT - 18), label)
-            else:
-                # Minor tick
-                painter.drawLine(int(x), int(RULER_HEIGHT - 8), int(x), int(RULER_HEIGHT))
-            
-            time += minor_interval
+        # Integer tick index avoids float drift from repeated addition
+        major_xs, minor_xs, major_times = _generate_ticks(
+            first, last, float(pps), float(minor_interval), minor_per_major
+        )
+        
+        self._minor_lines = _vertical_lines(minor_xs, RULER_HEIGHT - 8, RULER_HEIGHT)
+        self._major_lines = _vertical_lines(major_xs, RULER_HEIGHT - 15, RULER_HEIGHT)
+        self._major_labels = [
+            (x, self._format_time(time))
+            for x, time in zip(major_xs.tolist(), major_times.tolist())
+        ]
+        self._ticks_key = (pps, first, last)
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds as MM:SS or HH:MM:SS."""
@@ -367,27 +522,61 @@ class TrackHeader(QGraphicsRectItem):
         self.track_name = name
         self.track_type = track_type
         
-        self.setBrush(QBrush(COLOR_TRACK_HEADER))
-        self.setPen(QPen(Qt.NoPen))
+        self.setBrush(BRUSH_TRACK_HEADER)
+        self.setPen(NO_PEN)
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Add label
         self._label = QGraphicsTextItem(self)
         self._label.setPlainText(name)
         self._label.setDefaultTextColor(Qt.white)
-        font = QFont("Arial", 9, QFont.Bold)
-        self._label.setFont(font)
+        self._label.setFont(_font(9, bold=True))
         self._label.setPos(5, y + 5)
+        self._label.setCacheMode(QGraphicsItem.ItemCoordinateCache)
 
 
 class TimelineScene(QGraphicsScene):
     """
     The scene containing all timeline elements.
+    
+    Track backgrounds are painted in drawBackground() rather than
+    being scene items, so they cost no indexing or hit-testing.
     """
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
         self.setBackgroundBrush(QBrush(COLOR_BACKGROUND))
+        
+        # (y, is_audio) of each track row
+        self._track_rows: List[Tuple[float, bool]] = []
+        
+        # Clips lie along a few rows; a linear scan beats maintaining a
+        # BSP tree that is re-balanced on every add/remove/move
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+    
+    def set_track_rows(self, rows: List[Tuple[float, bool]]) -> None:
+        """Set the track rows to paint as (y, is_audio)."""
+        self._track_rows = rows
+        self.update()
+    
+    def drawBackground(self, painter, rect):
+        """Fill the background, then the visible parts of each track row."""
+        super().drawBackground(painter, rect)
+        
+        left = max(rect.left(), TRACK_HEADER_WIDTH)
+        width = rect.right() - left
+        if width <= 0:
+            return
+        
+        top, bottom = rect.top(), rect.bottom()
+        for y, is_audio in self._track_rows:
+            if y + TRACK_HEIGHT < top or y > bottom:
+                continue
+            painter.fillRect(
+                QRectF(left, y, width, TRACK_HEIGHT),
+                BRUSH_TRACK_BG_AUDIO if is_audio else BRUSH_TRACK_BG_VIDEO
+            )
 
 
 class TimelineView(QGraphicsView):
@@ -395,9 +584,11 @@ class TimelineView(QGraphicsView):
     The main view for the timeline scene.
     
     Signals:
-        time_changed: Emitted when playhead moves (time in seconds)
+        time_changed: Emitted when the user moves the playhead (time in seconds)
+        playhead_moved: Emitted after any playhead repaint, at most once per frame (seconds)
         clip_selected: Emitted when a clip is selected (clip_id)
-        clip_moved: Emitted when a clip is moved (clip_id, new_start_seconds)
+        clips_moved: Emitted once per drag with every moved clip
+            ([(clip_id, new_start_seconds), ...])
         clip_trimmed: Emitted when a clip is trimmed (clip_id, new_in, new_out, new_start)
         clip_deleted: Emitted when a clip should be deleted (clip_id)
         clip_split_requested: Emitted when split is requested (clip_id)
@@ -405,8 +596,9 @@ class TimelineView(QGraphicsView):
     
     # Signals
     time_changed = Signal(float)
+    playhead_moved = Signal(float)
     clip_selected = Signal(str)
-    clip_moved = Signal(str, float)
+    clips_moved = Signal(list)
     clip_trimmed = Signal(str, float, float, float)
     clip_deleted = Signal(str)
     clip_split_requested = Signal(str)
@@ -425,15 +617,54 @@ class TimelineView(QGraphicsView):
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         
+        # GPU rasterization is opt-in, as GL viewports misbehave on some drivers
+        settings = QSettings("LazyCut", "ManualEditor")
+        if QOpenGLWidget is not None and settings.value("timeline/opengl", False, type=bool):
+            self.setViewport(QOpenGLWidget())
+        
+        # Repainting the whole viewport is cheaper than computing the
+        # exposed region over many small clip items
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
+        
         # Timeline state
         self.pixels_per_second = 50.0  # Zoom level
         self.project: Optional["Project"] = None
         
         # Scene elements
+        self._items_root: Optional[QGraphicsRectItem] = None
         self._ruler: Optional[TimelineRuler] = None
         self._playhead: Optional[PlayheadItem] = None
         self._clip_items: Dict[str, TimelineClipItem] = {}
         self._track_headers: List[TrackHeader] = []
+        self._track_layout: Tuple[int, int] = (0, 0)  # (video, audio) rows shown
+        
+        # Clip geometry as parallel arrays (seconds / scene y), so a zoom
+        # change re-lays out items with one vectorized multiply
+        self._clip_ids: List[str] = []
+        self._clip_names: List[str] = []
+        self._clip_starts = np.empty(0, dtype=np.float64)
+        self._clip_durations = np.empty(0, dtype=np.float64)
+        self._clip_track_y = np.empty(0, dtype=np.float64)
+        self._clip_is_audio = np.empty(0, dtype=bool)
+        
+        # What the items currently show, so refreshes with no project change
+        # (or changes confined to a few tracks) skip untouched work
+        self._track_signatures: List[tuple] = []
+        self._laid_out_pps: Optional[float] = None
+        
+        # Playhead updates are coalesced to one repaint per frame
+        self._pending_playhead: Optional[float] = None
+        self._pending_playhead_emit = False
+        self._playhead_timer = QTimer(self)
+        self._playhead_timer.setSingleShot(True)
+        self._playhead_timer.setInterval(16)
+        self._playhead_timer.timeout.connect(self._flush_playhead)
+        
+        # Ctrl+wheel deltas are summed and applied as one zoom per event burst
+        self._wheel_accum_y = 0
+        self._wheel_zoom_pending = False
         
         # Initialize
         self._init_scene()
@@ -444,6 +675,13 @@ class TimelineView(QGraphicsView):
         self._ruler = TimelineRuler(2000, RULER_HEIGHT, self.pixels_per_second)
         self._scene.addItem(self._ruler)
         
+        # Invisible parent for track headers and clips: parenting is cheaper
+        # than scene.addItem per item (a QGraphicsItemGroup would also
+        # swallow the children's mouse events)
+        self._items_root = QGraphicsRectItem()
+        self._items_root.setFlag(QGraphicsItem.ItemHasNoContents, True)
+        self._scene.addItem(self._items_root)
+        
         # Create playhead
         total_height = RULER_HEIGHT + TRACK_HEIGHT * 3  # Default 3 tracks
         self._playhead = PlayheadItem(0, total_height)
@@ -455,23 +693,22 @@ class TimelineView(QGraphicsView):
     def set_project(self, project: "Project") -> None:
         """Load a project into the timeline."""
         self.project = project
+        self._track_signatures = []
         self.refresh_timeline()
     
     def refresh_timeline(self) -> None:
-        """Rebuild the timeline from the current project."""
+        """
+        Sync the timeline with the current project.
+        
+        Track rows are only rebuilt when the track count changes, and
+        clip items are diffed by id: existing items are moved in place,
+        only vanished clips are removed and only new clips are added.
+        Tracks whose clips are unchanged since the last sync are skipped,
+        so a refresh with no project change does nothing.
+        """
         if not self.project:
             return
         
-        # Clear existing clips
-        for clip_id in list(self._clip_items.keys()):
-            item = self._clip_items.pop(clip_id)
-            self._scene.removeItem(item)
-        
-        # Clear track headers
-        for header in self._track_headers:
-            self._scene.removeItem(header)
-        self._track_headers.clear()
-        
         # Calculate total tracks
         num_video_tracks = len(self.project.video_tracks)
         num_audio_tracks = len(self.project.audio_tracks)
@@ -479,96 +716,198 @@ class TimelineView(QGraphicsView):
             num_video_tracks = 1
         if num_audio_tracks == 0:
             num_audio_tracks = 2
+        layout = (num_video_tracks, num_audio_tracks)
         
-        total_tracks = num_video_tracks + num_audio_tracks
+        signatures = [
+            self._track_signature(track)
+            for track in self.project.video_tracks + self.project.audio_tracks
+        ]
+        same_pps = self.pixels_per_second == self._laid_out_pps
+        if (layout == self._track_layout and same_pps
+                and signatures == self._track_signatures):
+            return
         
-        # Calculate dimensions
-        track_area_start = RULER_HEIGHT
-        total_height = RULER_HEIGHT + (TRACK_HEIGHT + TRACK_SPACING) * total_tracks
-        timeline_width = max(2000, self.project.duration * self.pixels_per_second + 500)
+        # Only re-lay out changed tracks, unless every row moved or rescaled
+        dirty_tracks = None
+        if (layout == self._track_layout and same_pps
+                and len(signatures) == len(self._track_signatures)):
+            dirty_tracks = [
+                i for i, (new, old) in enumerate(zip(signatures, self._track_signatures))
+                if new != old
+            ]
         
-        # Update ruler
-        self._ruler.set_width(timeline_width)
-        self._ruler.set_pixels_per_second(self.pixels_per_second)
+        with self._batch_update():
+            if layout != self._track_layout:
+                self._rebuild_tracks(num_video_tracks, num_audio_tracks)
+            
+            self._sync_clips(dirty_tracks)
         
-        # Create track headers and backgrounds
-        y = track_area_start
+        self._track_signatures = signatures
+        self._update_extent()
+    
+    @staticmethod
+    def _track_signature(track: list) -> tuple:
+        """Everything about a track's clips that affects their items."""
+        return tuple(
+            (clip.id, clip.name, clip.timeline_start, clip.duration, clip.enabled)
+            for clip in track
+        )
+    
+    def _apply_zoom(self, pixels_per_second: float) -> None:
+        """Re-lay out existing items for a new zoom level, keeping the playhead time."""
+        playhead_time = self.get_playhead_time()
+        self.pixels_per_second = pixels_per_second
         
-        # Video tracks
-        for i in range(num_video_tracks):
-            header = TrackHeader(y, f"Video {i + 1}", "video")
-            self._scene.addItem(header)
-            self._track_headers.append(header)
-            
-            # Track background
-            bg = QGraphicsRectItem(TRACK_HEADER_WIDTH, y, timeline_width, TRACK_HEIGHT)
-            bg.setBrush(QBrush(COLOR_TRACK_BG))
-            bg.setPen(QPen(Qt.NoPen))
-            bg.setZValue(-1)
-            self._scene.addItem(bg)
-            
-            y += TRACK_HEIGHT + TRACK_SPACING
+        if self.project:
+            with self._batch_update():
+                self._layout_clips()
+            self._update_extent()
+        else:
+            self._ruler.set_pixels_per_second(pixels_per_second)
         
-        # Audio tracks
-        for i in range(num_audio_tracks):
-            header = TrackHeader(y, f"Audio {i + 1}", "audio")
-            self._scene.addItem(header)
+        self.set_playhead_time(playhead_time)
+    
+    @contextmanager
+    def _batch_update(self):
+        """Suppress scene signals and viewport repaints during bulk item changes."""
+        self.viewport().setUpdatesEnabled(False)
+        self._scene.blockSignals(True)
+        try:
+            yield
+        finally:
+            self._scene.blockSignals(False)
+            self.viewport().setUpdatesEnabled(True)
+            self.viewport().update()
+    
+    def _rebuild_tracks(self, num_video_tracks: int, num_audio_tracks: int) -> None:
+        """Recreate track headers and background rows for a new track count."""
+        for header in self._track_headers:
+            self._scene.removeItem(header)
+        self._track_headers.clear()
+        rows = []
+        
+        y = RULER_HEIGHT
+        tracks = [(f"Video {i + 1}", "video") for i in range(num_video_tracks)]
+        tracks += [(f"Audio {i + 1}", "audio") for i in range(num_audio_tracks)]
+        
+        for name, track_type in tracks:
+            header = TrackHeader(y, name, track_type)
+            header.setParentItem(self._items_root)
             self._track_headers.append(header)
             
-            # Track background
-            bg = QGraphicsRectItem(TRACK_HEADER_WIDTH, y, timeline_width, TRACK_HEIGHT)
-            bg.setBrush(QBrush(COLOR_TRACK_BG.darker(110)))
-            bg.setPen(QPen(Qt.NoPen))
-            bg.setZValue(-1)
-            self._scene.addItem(bg)
+            rows.append((y, track_type == "audio"))
             
             y += TRACK_HEIGHT + TRACK_SPACING
         
-        # Add video clips
-        for track_idx, track in enumerate(self.project.video_tracks):
-            track_y = track_area_start + track_idx * (TRACK_HEIGHT + TRACK_SPACING)
-            
+        self._scene.set_track_rows(rows)
+        self._track_layout = (num_video_tracks, num_audio_tracks)
+    
+    def _sync_clips(self, dirty_tracks: Optional[List[int]] = None) -> None:
+        """
+        Rebuild the clip geometry arrays from the project and lay out items.
+        
+        Args:
+            dirty_tracks: Indices (video tracks first, then audio) of the only
+                tracks whose items need laying out; None lays out all of them
+        """
+        row_height = TRACK_HEIGHT + TRACK_SPACING
+        num_video_tracks = self._track_layout[0]
+        
+        rows = [
+            (track, RULER_HEIGHT + track_idx * row_height, False)
+            for track_idx, track in enumerate(self.project.video_tracks)
+        ]
+        rows += [
+            (track, RULER_HEIGHT + (num_video_tracks + track_idx) * row_height, True)
+            for track_idx, track in enumerate(self.project.audio_tracks)
+        ]
+        
+        ids, names, starts, durations, track_ys, is_audio = [], [], [], [], [], []
+        for track, track_y, audio in rows:
             for clip in track:
                 if not clip.enabled:
                     continue
-                
-                x = TRACK_HEADER_WIDTH + clip.timeline_start * self.pixels_per_second
-                width = clip.duration * self.pixels_per_second
-                
-                item = TimelineClipItem(
-                    clip_id=clip.id,
-                    x=x,
-                    y=track_y,
-                    width=width,
-                    height=TRACK_HEIGHT - 4,
-                    name=clip.name,
-                    is_audio=False
-                )
-                self._scene.addItem(item)
-                self._clip_items[clip.id] = item
-        
-        # Add audio clips
-        for track_idx, track in enumerate(self.project.audio_tracks):
-            track_y = track_area_start + (num_video_tracks + track_idx) * (TRACK_HEIGHT + TRACK_SPACING)
+                ids.append(clip.id)
+                names.append(clip.name)
+                starts.append(clip.timeline_start)
+                durations.append(clip.duration)
+                track_ys.append(track_y)
+                is_audio.append(audio)
+        
+        self._clip_ids = ids
+        self._clip_names = names
+        self._clip_starts = np.asarray(starts, dtype=np.float64)
+        self._clip_durations = np.asarray(durations, dtype=np.float64)
+        self._clip_track_y = np.asarray(track_ys, dtype=np.float64)
+        self._clip_is_audio = np.asarray(is_audio, dtype=bool)
+        
+        if dirty_tracks is None:
+            self._layout_clips()
+        else:
+            dirty_ys = [rows[i][1] for i in dirty_tracks]
+            self._layout_clips(np.isin(self._clip_track_y, dirty_ys))
+    
+    def _layout_clips(self, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Create, move or remove clip items to match the geometry arrays.
+        
+        Args:
+            mask: Boolean array selecting the clips to lay out; None for all
+        """
+        pps = self.pixels_per_second
+        xs = TRACK_HEADER_WIDTH + self._clip_starts * pps
+        widths = self._clip_durations * pps
+        height = TRACK_HEIGHT - 4
+        
+        if mask is None:
+            indices = range(len(self._clip_ids))
+            self._laid_out_pps = pps
+        else:
+            indices = np.flatnonzero(mask).tolist()
+        
+        xs = xs.tolist()
+        track_ys = self._clip_track_y.tolist()
+        widths = widths.tolist()
+        is_audio_flags = self._clip_is_audio.tolist()
+        
+        for i in indices:
+            clip_id, name, x, y = self._clip_ids[i], self._clip_names[i], xs[i], track_ys[i]
+            width, is_audio = widths[i], is_audio_flags[i]
+            item = self._clip_items.get(clip_id)
+            if item is not None and item.is_audio == is_audio:
+                item.set_geometry(x, y, width, height, name)
+                continue
             
-            for clip in track:
-                if not clip.enabled:
-                    continue
-                
-                x = TRACK_HEADER_WIDTH + clip.timeline_start * self.pixels_per_second
-                width = clip.duration * self.pixels_per_second
-                
-                item = TimelineClipItem(
-                    clip_id=clip.id,
-                    x=x,
-                    y=track_y,
-                    width=width,
-                    height=TRACK_HEIGHT - 4,
-                    name=clip.name,
-                    is_audio=True
-                )
-                self._scene.addItem(item)
-                self._clip_items[clip.id] = item
+            if item is not None:
+                self._scene.removeItem(item)
+            
+            item = TimelineClipItem(
+                clip_id=clip_id,
+                x=x,
+                y=y,
+                width=width,
+                height=height,
+                name=name,
+                is_audio=is_audio,
+                parent=self._items_root
+            )
+            self._clip_items[clip_id] = item
+        
+        # Remove clips that no longer exist
+        if len(self._clip_items) > len(self._clip_ids):
+            current = set(self._clip_ids)
+            for clip_id in [cid for cid in self._clip_items if cid not in current]:
+                self._scene.removeItem(self._clip_items.pop(clip_id))
+    
+    def _update_extent(self) -> None:
+        """Resize ruler, playhead and scene to the project."""
+        total_tracks = sum(self._track_layout)
+        total_height = RULER_HEIGHT + (TRACK_HEIGHT + TRACK_SPACING) * total_tracks
+        timeline_width = max(2000, self.project.duration * self.pixels_per_second + 500)
+        
+        # Update ruler
+        self._ruler.set_width(timeline_width)
+        self._ruler.set_pixels_per_second(self.pixels_per_second)
         
         # Update playhead height
         if self._playhead:
@@ -578,13 +917,38 @@ class TimelineView(QGraphicsView):
         self._scene.setSceneRect(0, 0, timeline_width, total_height)
     
     def set_playhead_time(self, seconds: float) -> None:
-        """Set the playhead position in seconds."""
+        """Set the playhead position in seconds (applied on the next frame)."""
+        self._schedule_playhead(seconds, emit=False)
+    
+    def _schedule_playhead(self, seconds: float, emit: bool) -> None:
+        """Queue a playhead move; only the latest one per frame is painted."""
+        self._pending_playhead = seconds
+        self._pending_playhead_emit = self._pending_playhead_emit or emit
+        if not self._playhead_timer.isActive():
+            self._playhead_timer.start()
+    
+    def _flush_playhead(self) -> None:
+        """Apply the latest queued playhead move."""
+        if self._pending_playhead is None:
+            return
+        
+        seconds = self._pending_playhead
+        emit = self._pending_playhead_emit
+        self._pending_playhead = None
+        self._pending_playhead_emit = False
+        
         if self._playhead:
             x = TRACK_HEADER_WIDTH + seconds * self.pixels_per_second
             self._playhead.set_position(x)
+        
+        if emit:
+            self.time_changed.emit(seconds)
+        self.playhead_moved.emit(seconds)
     
     def get_playhead_time(self) -> float:
         """Get the current playhead time in seconds."""
+        if self._pending_playhead is not None:
+            return self._pending_playhead
         if self._playhead:
             x = self._playhead.get_x_position()
             return max(0, (x - TRACK_HEADER_WIDTH) / self.pixels_per_second)
@@ -592,25 +956,33 @@ class TimelineView(QGraphicsView):
     
     def zoom_in(self) -> None:
         """Increase zoom level."""
-        self.pixels_per_second = min(200, self.pixels_per_second * 1.25)
-        self.refresh_timeline()
+        self._apply_zoom(min(200, self.pixels_per_second * 1.25))
     
     def zoom_out(self) -> None:
         """Decrease zoom level."""
-        self.pixels_per_second = max(5, self.pixels_per_second / 1.25)
-        self.refresh_timeline()
+        self._apply_zoom(max(5, self.pixels_per_second / 1.25))
     
     def wheelEvent(self, event: QWheelEvent) -> None:
         """Handle scroll wheel for zooming with Ctrl."""
         if event.modifiers() & Qt.ControlModifier:
-            if event.angleDelta().y() > 0:
-                self.zoom_in()
-            else:
-                self.zoom_out()
+            self._wheel_accum_y += event.angleDelta().y()
+            if not self._wheel_zoom_pending:
+                self._wheel_zoom_pending = True
+                QTimer.singleShot(0, self._apply_wheel_zoom)
             event.accept()
         else:
             super().wheelEvent(event)
     
+    def _apply_wheel_zoom(self) -> None:
+        """Zoom by the wheel delta accumulated since the last event-loop pass."""
+        factor = 1.25 ** (self._wheel_accum_y / 120)
+        self._wheel_accum_y = 0
+        self._wheel_zoom_pending = False
+        
+        pixels_per_second = min(200, max(5, self.pixels_per_second * factor))
+        if pixels_per_second != self.pixels_per_second:
+            self._apply_zoom(pixels_per_second)
+    
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press for playhead positioning."""
         if event.button() == Qt.LeftButton:
@@ -621,9 +993,8 @@ class TimelineView(QGraphicsView):
                 # Set playhead position
                 new_x = max(TRACK_HEADER_WIDTH, scene_pos.x())
                 if self._playhead:
-                    self._playhead.set_position(new_x)
                     time = (new_x - TRACK_HEADER_WIDTH) / self.pixels_per_second
-                    self.time_changed.emit(time)
+                    self._schedule_playhead(time, emit=True)
                 event.accept()
                 return
         
@@ -640,12 +1011,20 @@ class TimelineWidget(QWidget):
     # Forward signals from view
     time_changed = Signal(float)
     clip_selected = Signal(str)
+    clips_moved = Signal(list)
     clip_deleted = Signal(str)
     clip_split_requested = Signal(str)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Coalesce zoom slider ticks to at most one re-layout per frame
+        self._pending_pps = 50.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_pending_zoom)
+        
         self._setup_ui()
         self._connect_signals()
     
@@ -685,7 +1064,7 @@ class TimelineWidget(QWidget):
         
         # Time display
         self.time_label = QLabel("00:00:00.000")
-        self.time_label.setStyleSheet("font-family: monospace; font-size: 12px;")
+        self.time_label.setObjectName("timelineTimeLabel")
         controls.addWidget(self.time_label)
         
         controls_widget = QWidget()
@@ -695,9 +1074,10 @@ class TimelineWidget(QWidget):
     
     def _connect_signals(self) -> None:
         """Connect internal signals."""
-        self.view.time_changed.connect(self._on_time_changed)
+        self.view.playhead_moved.connect(self._on_time_changed)
         self.view.time_changed.connect(self.time_changed)
         self.view.clip_selected.connect(self.clip_selected)
+        self.view.clips_moved.connect(self.clips_moved)
         self.view.clip_deleted.connect(self.clip_deleted)
         self.view.clip_split_requested.connect(self.clip_split_requested)
     
@@ -711,9 +1091,14 @@ class TimelineWidget(QWidget):
         self.time_label.setText(f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}")
     
     def _on_zoom_changed(self, value: int) -> None:
-        """Handle zoom slider change."""
-        self.view.pixels_per_second = float(value)
-        self.view.refresh_timeline()
+        """Handle zoom slider change (applied on the next zoom timer tick)."""
+        self._pending_pps = float(value)
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+    
+    def _apply_pending_zoom(self) -> None:
+        """Apply the latest zoom slider value."""
+        self.view._apply_zoom(self._pending_pps)
     
     def set_project(self, project: "Project") -> None:
         """Load a project into the timeline."""
@@ -724,9 +1109,8 @@ class TimelineWidget(QWidget):
         self.view.refresh_timeline()
     
     def set_playhead_time(self, seconds: float) -> None:
-        """Set the playhead position."""
+        """Set the playhead position (time display follows via playhead_moved)."""
         self.view.set_playhead_time(seconds)
-        self._on_time_changed(seconds)
     
     def get_playhead_time(self) -> float:
         """Get the current playhead time."""
@@ -1,11 +1,17 @@
 import os
+import asyncio
+import hashlib
 import sqlite3
 import datetime
+import time
 import json
 import logging
 from fastapi import FastAPI, HTTPException, Request, Depends
 from pydantic import BaseModel
 import google.generativeai as genai
+import aiosqlite
+from cachetools import TTLCache
+from aiosqlitepool import SQLiteConnectionPool
 from typing import List, Optional
 from dotenv import load_dotenv
 
@@ -22,32 +28,89 @@ DB_FILE = "lazycut.db"
 
 # Limits
 DAILY_LIMIT = 4
+
+# Long transcripts: summarize older windows, keep the latest one verbatim (off by default)
+CONDENSE_TRANSCRIPTS = os.getenv("CONDENSE_TRANSCRIPTS", "0") == "1"
+CONDENSE_THRESHOLD_CHARS = int(os.getenv("CONDENSE_THRESHOLD_CHARS", "60000"))
+CONDENSE_WINDOW_CHARS = int(os.getenv("CONDENSE_WINDOW_CHARS", "20000"))
 ADMIN_KEYS = ["harper_master_key_2025"]
+MAX_CONCURRENT_AI_CALLS = 8  # across all worker processes
+
+# Number of uvicorn worker processes (set for the workers by __main__ below)
+WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
 
 # --- LOGGING ---
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("LazyCutServer")
 
 # --- DATABASE SETUP ---
-def init_db():
+# Per-connection settings (WAL is persistent on the file and set once in init_db)
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+def get_conn():
     conn = sqlite3.connect(DB_FILE)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def init_db():
+    conn = get_conn()
+    # Persistent on the database file: readers no longer block behind writers
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
+    # WITHOUT ROWID stores rows in the primary-key b-tree itself, so the
+    # (hardware_id, date) lookup in the rate limiter needs no second fetch
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS usage (
             hardware_id TEXT,
             date TEXT,
             count INTEGER,
             PRIMARY KEY (hardware_id, date)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS ai_cache (
+            h TEXT PRIMARY KEY,
+            payload TEXT,
+            ts INTEGER
         )
     ''')
+    # For pruning expired / oldest cache rows
+    cursor.execute("CREATE INDEX IF NOT EXISTS ai_cache_ts ON ai_cache (ts)")
     conn.commit()
     conn.close()
 
-init_db()
+async def open_async_conn():
+    """Connection factory for the request pool."""
+    conn = await aiosqlite.connect(DB_FILE)
+    for pragma in SQLITE_PRAGMAS:
+        await conn.execute(pragma)
+    return conn
+
+# Long-lived connections keep SQLite's page cache warm across requests,
+# and aiosqlite keeps DB waits off the event loop
+db_pool: Optional[SQLiteConnectionPool] = None
 
 # --- FASTAPI APP ---
 app = FastAPI(title="LazyCut Backend", version="2.0")
 
+@app.on_event("startup")
+async def open_db_pool():
+    global db_pool
+    # Runs in each worker; CREATE IF NOT EXISTS and busy_timeout make that safe
+    init_db()
+    db_pool = SQLiteConnectionPool(open_async_conn)
+
+@app.on_event("shutdown")
+async def close_db_pool():
+    if db_pool is not None:
+        await db_pool.close()
+
 # --- Pydantic Models ---
 class DirectorRequest(BaseModel):
     hardware_id: str
@@ -55,39 +118,35 @@ class DirectorRequest(BaseModel):
     token: Optional[str] = None
 
 # --- AI LOGIC ---
-def generate_director_cut_gemini(transcript_text):
-    if not GEMINI_API_KEY:
-        raise HTTPException(status_code=500, detail="Server misconfigured: Missing API Key")
-    
-    genai.configure(api_key=GEMINI_API_KEY)
-    
-    # Model Selection Strategy
-    model_names = ['gemini-2.5-flash', 'gemini-1.5-flash', 'gemini-pro']
-    model = None
-    
+# Model Selection Strategy
+MODEL_NAMES = ['gemini-2.5-flash', 'gemini-1.5-flash', 'gemini-pro']
+
+def _pick_model(model_names):
     for name in model_names:
         try:
-            model = genai.GenerativeModel(name)
-            break
+            return genai.GenerativeModel(name)
         except:
             continue
-            
-    if not model:
-        # Fallback to whatever is available
-        try:
-            for m in genai.list_models():
-                if 'generateContent' in m.supported_generation_methods:
-                    model = genai.GenerativeModel(m.name)
-                    break
-        except:
-            pass
+    
+    # Fallback to whatever is available
+    try:
+        for m in genai.list_models():
+            if 'generateContent' in m.supported_generation_methods:
+                return genai.GenerativeModel(m.name)
+    except:
+        pass
+    return None
 
-    if not model:
-        raise HTTPException(status_code=500, detail="No AI models available.")
+# Configured and picked once, then shared by all requests
+MODEL = None
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+    MODEL = _pick_model(MODEL_NAMES)
 
-    prompt = f"""
+# Static part of the prompt. Far below Gemini's minimum cacheable size,
+# so it is sent with every request rather than through context caching
+EDITORIAL_INSTRUCTIONS = """
     You are a Documentary Editor.
-    TRANSCRIPT: {transcript_text}
     
     GOAL: Create a coherent narrative.
     RULES:
@@ -97,14 +156,124 @@ def generate_director_cut_gemini(transcript_text):
     4. Remove filler.
     
     OUTPUT JSON ONLY:
-    {{
+    {
       "cut_list": [global_ids_of_selected_sentences],
       "seo_title": "Viral_Title_Here"
-    }}
+    }
+    """
+
+def _generate(model, transcript_text):
+    transcript_prompt = f"""
+    TRANSCRIPT: {transcript_text}
+    
+    OUTPUT JSON ONLY.
     """
+    return model.generate_content(EDITORIAL_INSTRUCTIONS + transcript_prompt)
+
+# Results for recently seen transcripts (users often resubmit the same script):
+# in memory per process, backed by the ai_cache table shared by all workers
+RESULT_CACHE_TTL = 24 * 3600
+_RESULT_CACHE = TTLCache(maxsize=2048, ttl=RESULT_CACHE_TTL)
+
+# The ai_cache table is pruned of expired rows, and down to the newest
+# AI_CACHE_MAX_ROWS, at most once per AI_CACHE_PRUNE_INTERVAL per worker
+AI_CACHE_MAX_ROWS = 20000
+AI_CACHE_PRUNE_INTERVAL = 3600  # seconds
+_last_cache_prune = 0.0
+
+def transcript_key(transcript_text):
+    return hashlib.sha256(transcript_text.encode("utf-8")).hexdigest()
+
+async def get_cached_result(key):
+    hit = _RESULT_CACHE.get(key)
+    if hit is not None:
+        return hit
+    
+    async with db_pool.connection() as conn:
+        cursor = await conn.execute(
+            "SELECT payload FROM ai_cache WHERE h = ? AND ts > ?",
+            (key, int(time.time()) - RESULT_CACHE_TTL)
+        )
+        row = await cursor.fetchone()
+    if row is None:
+        return None
+    
+    hit = json.loads(row[0])
+    _RESULT_CACHE[key] = hit
+    return hit
+
+async def store_cached_result(key, data):
+    global _last_cache_prune
+    _RESULT_CACHE[key] = data
+    now = time.time()
+    async with db_pool.connection() as conn:
+        await conn.execute(
+            "INSERT OR REPLACE INTO ai_cache (h, payload, ts) VALUES (?, ?, ?)",
+            (key, json.dumps(data), int(now))
+        )
+        if now - _last_cache_prune >= AI_CACHE_PRUNE_INTERVAL:
+            _last_cache_prune = now
+            await prune_cached_results(conn, now)
+        await conn.commit()
+
+async def prune_cached_results(conn, now):
+    """Deletes expired ai_cache rows, then all but the newest AI_CACHE_MAX_ROWS."""
+    await conn.execute(
+        "DELETE FROM ai_cache WHERE ts <= ?",
+        (int(now) - RESULT_CACHE_TTL,)
+    )
+    await conn.execute('''
+        DELETE FROM ai_cache WHERE ts < (
+            SELECT ts FROM ai_cache ORDER BY ts DESC LIMIT 1 OFFSET ?
+        )
+    ''', (AI_CACHE_MAX_ROWS - 1,))
+
+SUMMARY_PROMPT = """
+    Summarize this documentary transcript excerpt for an editor.
+    Keep every timecode, sentence ID and direct quote that carries the story;
+    drop filler, repetition and false starts. Output plain text only.
+    """
+
+def _split_windows(text, window_chars):
+    """Split text into ~window_chars pieces, breaking on whitespace."""
+    windows = []
+    start = 0
+    while start < len(text):
+        end = start + window_chars
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            if space > start:
+                end = space
+        windows.append(text[start:end])
+        start = end
+    return windows
+
+def condense_transcript(model, transcript_text):
+    """
+    Recursively summarize all but the latest window of a long transcript,
+    bounding the size (and so latency and cost) of the final prompt.
+    """
+    windows = _split_windows(transcript_text, CONDENSE_WINDOW_CHARS)
+    summary = ""
+    for window in windows[:-1]:
+        response = model.generate_content(
+            f"{SUMMARY_PROMPT}\nSUMMARY SO FAR: {summary}\n\nEXCERPT: {window}"
+        )
+        summary = response.text.strip()
+    return f"[SUMMARY OF EARLIER PART] {summary}\n\n[LATEST PART] {windows[-1]}"
+
+def generate_director_cut_gemini(transcript_text):
+    if not GEMINI_API_KEY:
+        raise HTTPException(status_code=500, detail="Server misconfigured: Missing API Key")
+    
+    model = MODEL
+    if not model:
+        raise HTTPException(status_code=500, detail="No AI models available.")
     
     try:
-        response = model.generate_content(prompt)
+        if CONDENSE_TRANSCRIPTS and len(transcript_text) > CONDENSE_THRESHOLD_CHARS:
+            transcript_text = condense_transcript(model, transcript_text)
+        response = _generate(model, transcript_text)
         text = response.text.strip()
         # Clean markdown
         if text.startswith("```json"): text = text[7:]
@@ -116,6 +285,11 @@ def generate_director_cut_gemini(transcript_text):
         logger.error(f"AI Error: {e}")
         raise HTTPException(status_code=500, detail=f"AI Processing Failed: {str(e)}")
 
+# Caps in-flight Gemini calls so bursts queue here instead of hitting rate limits.
+# Each worker process gets its share, so the total stays at MAX_CONCURRENT_AI_CALLS
+# (at least one call per worker when there are more workers than that)
+_GEMINI_SEM = asyncio.Semaphore(max(1, MAX_CONCURRENT_AI_CALLS // WORKERS))
+
 # --- ENDPOINTS ---
 @app.post("/process_script")
 async def process_script(request: DirectorRequest):
@@ -123,36 +297,50 @@ async def process_script(request: DirectorRequest):
     token = request.token
     today = datetime.date.today().isoformat()
     
+    # Repeated transcripts are answered from cache without using quota
+    key = transcript_key(request.transcript)
+    cached = await get_cached_result(key)
+    if cached is not None:
+        return cached
+    
     # 1. Authorization & Rate Limiting
     is_admin = token in ADMIN_KEYS
     
     if not is_admin:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute("SELECT count FROM usage WHERE hardware_id = ? AND date = ?", (hw_id, today))
-        row = cursor.fetchone()
-        current_count = row[0] if row else 0
-        conn.close()
+        # Reserve a slot atomically before the (slow) AI call; the WHERE on
+        # the update makes it a no-op, returning no row, once at the limit
+        async with db_pool.connection() as conn:
+            cursor = await conn.execute('''
+                INSERT INTO usage (hardware_id, date, count)
+                VALUES (?, ?, 1)
+                ON CONFLICT(hardware_id, date) DO UPDATE SET count = count + 1
+                WHERE count < ?
+                RETURNING count
+            ''', (hw_id, today, DAILY_LIMIT))
+            row = await cursor.fetchone()
+            await conn.commit()
         
-        if current_count >= DAILY_LIMIT:
+        if row is None:
             logger.warning(f"Rate limit reached for {hw_id}")
             raise HTTPException(status_code=403, detail="Daily Limit Reached")
 
     # 2. AI Processing
-    result = generate_director_cut_gemini(request.transcript)
+    try:
+        # The SDK call blocks, so keep it off the event loop
+        async with _GEMINI_SEM:
+            result = await asyncio.to_thread(generate_director_cut_gemini, request.transcript)
+    except Exception:
+        # Failed requests don't count against the daily limit
+        if not is_admin:
+            async with db_pool.connection() as conn:
+                await conn.execute(
+                    "UPDATE usage SET count = count - 1 WHERE hardware_id = ? AND date = ?",
+                    (hw_id, today)
+                )
+                await conn.commit()
+        raise
     
-    # 3. Update Usage (if not admin)
-    if not is_admin:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO usage (hardware_id, date, count)
-            VALUES (?, ?, 1)
-            ON CONFLICT(hardware_id, date) DO UPDATE SET count = count + 1
-        ''', (hw_id, today))
-        conn.commit()
-        conn.close()
-        
+    await store_cached_result(key, result)
     return result
 
 @app.get("/")
@@ -161,4 +349,16 @@ def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Multiple workers need the app as an import string; "auto" picks
+    # uvloop/httptools when installed and falls back on platforms without them
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Inherited by the worker processes, which size _GEMINI_SEM from it
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        loop="auto",
+        http="auto",
+    )
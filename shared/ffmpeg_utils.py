@@ -8,13 +8,27 @@ All operations are executed via subprocess to ensure cross-platform
 compatibility and avoid binary dependencies beyond FFmpeg itself.
 """
 
+import asyncio
 import subprocess
 import json
+import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('LazyCut.FFmpeg')
+
+# Faster C decoder when available; both accept the raw bytes from ffprobe
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 @dataclass
 class VideoMetadata:
@@ -37,10 +51,24 @@ class AudioMetadata:
     codec: str              # Audio codec name
 
 
+# Hide console windows for child processes on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# FFmpeg jobs only report errors: no progress lines piling up in a pipe
+_QUIET_ARGS = ["-nostats", "-loglevel", "error"]
+_SUBPROCESS_KW = dict(
+    stdout=subprocess.DEVNULL,
+    stderr=subprocess.PIPE,
+    creationflags=_CREATION_FLAGS
+)
+
+
+@lru_cache(maxsize=1)
 def get_ffmpeg_path() -> str:
     """
     Finds the FFmpeg binary path.
     Checks local directory first, then system PATH.
+    The result is cached for the lifetime of the process.
     """
     # Check local directory (bundled with app)
     local_ffmpeg = os.path.join(os.getcwd(), "ffmpeg.exe" if os.name == "nt" else "ffmpeg")
@@ -57,10 +85,12 @@ def get_ffmpeg_path() -> str:
     )
 
 
+@lru_cache(maxsize=1)
 def get_ffprobe_path() -> str:
     """
     Finds the FFprobe binary path.
     Checks local directory first, then system PATH.
+    The result is cached for the lifetime of the process.
     """
     local_ffprobe = os.path.join(os.getcwd(), "ffprobe.exe" if os.name == "nt" else "ffprobe")
     if os.path.exists(local_ffprobe):
@@ -75,6 +105,123 @@ def get_ffprobe_path() -> str:
     )
 
 
+# Hardware H.264 encoders in order of preference
+HW_H264_ENCODERS = ["h264_nvenc", "h264_qsv", "h264_videotoolbox", "h264_amf"]
+
+
+@lru_cache(maxsize=1)
+def get_h264_encoder() -> str:
+    """
+    Picks the H.264 encoder to use, preferring hardware encoders.
+    
+    An encoder being compiled into FFmpeg doesn't mean the hardware is
+    present, so each listed candidate is tried on a tiny test clip.
+    The result is cached for the lifetime of the process.
+    
+    Returns:
+        Encoder name, "libx264" if no hardware encoder works
+    """
+    try:
+        ffmpeg = get_ffmpeg_path()
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            creationflags=_CREATION_FLAGS
+        )
+    except (FileNotFoundError, OSError, subprocess.TimeoutExpired):
+        return "libx264"
+    
+    for encoder in HW_H264_ENCODERS:
+        if encoder not in result.stdout:
+            continue
+        cmd = [
+            ffmpeg, "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-frames:v", "1", "-c:v", encoder,
+            "-f", "null", "-"
+        ]
+        try:
+            subprocess.run(cmd, capture_output=True, check=True, timeout=10,
+                           creationflags=_CREATION_FLAGS)
+            return encoder
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            continue
+    
+    return "libx264"
+
+
+def h264_encoder_args(crf: int, fast: bool = False, use_hw: bool = True) -> List[str]:
+    """
+    Builds video encoder arguments for roughly CRF-equivalent quality.
+    
+    Args:
+        crf: libx264-style constant quality (lower = better)
+        fast: Favor speed over compression (e.g. for proxies)
+        use_hw: Allow a hardware encoder if one is available
+        
+    Returns:
+        FFmpeg arguments starting with "-c:v"
+    """
+    encoder = get_h264_encoder() if use_hw else "libx264"
+    q = str(crf)
+    
+    if encoder == "h264_nvenc":
+        return ["-c:v", encoder, "-preset", "p1" if fast else "p5",
+                "-rc", "vbr", "-cq", q, "-b:v", "0"]
+    if encoder == "h264_qsv":
+        return ["-c:v", encoder, "-preset", "veryfast" if fast else "medium",
+                "-global_quality", q]
+    if encoder == "h264_videotoolbox":
+        # -q:v runs 1-100 with higher = better
+        return ["-c:v", encoder, "-q:v", str(max(1, min(100, 100 - 2 * crf)))]
+    if encoder == "h264_amf":
+        return ["-c:v", encoder, "-quality", "speed" if fast else "quality",
+                "-rc", "cqp", "-qp_i", q, "-qp_p", q]
+    return ["-c:v", "libx264", "-preset", "ultrafast" if fast else "fast", "-crf", q]
+
+
+def _run(cmd: List[str], output_path: str) -> bool:
+    """Runs an FFmpeg command; True if it succeeded and produced output_path."""
+    try:
+        subprocess.run(cmd, **_SUBPROCESS_KW, check=True)
+        return os.path.exists(output_path)
+    except subprocess.CalledProcessError as e:
+        _log_failure(cmd, e.returncode, e.stderr)
+        return False
+    except OSError as e:  # Includes FileNotFoundError for a missing binary
+        logger.error(f"Could not run {cmd[0]}: {e}")
+        return False
+
+
+async def _run_async(cmd: List[str], output_path: str) -> bool:
+    """Async version of _run() that doesn't block the event loop."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            creationflags=_CREATION_FLAGS
+        )
+    except OSError as e:
+        logger.error(f"Could not run {cmd[0]}: {e}")
+        return False
+    
+    # communicate() drains stderr, so a chatty failure can't fill the pipe
+    _, stderr = await process.communicate()
+    if process.returncode != 0:
+        _log_failure(cmd, process.returncode, stderr)
+        return False
+    return os.path.exists(output_path)
+
+
+def _log_failure(cmd: List[str], returncode: int, stderr: Optional[bytes]) -> None:
+    """Logs a failed FFmpeg run with its (-loglevel error) stderr output."""
+    details = stderr.decode(errors="replace").strip() if stderr else ""
+    logger.error(f"{os.path.basename(cmd[0])} exited with {returncode}: {details}")
+
+
 def get_video_metadata(file_path: str) -> VideoMetadata:
     """
     Extracts video metadata using FFprobe.
@@ -107,13 +254,12 @@ def get_video_metadata(file_path: str) -> VideoMetadata:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+            creationflags=_CREATION_FLAGS
         )
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
     except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"FFprobe failed: {e.stderr}")
+        raise RuntimeError(f"FFprobe failed: {e.stderr.decode(errors='replace')}")
     except json.JSONDecodeError:
         raise RuntimeError("Failed to parse FFprobe output")
     
@@ -160,6 +306,31 @@ def get_video_metadata(file_path: str) -> VideoMetadata:
     )
 
 
+def get_video_metadata_many(file_paths: List[str]) -> List[VideoMetadata]:
+    """
+    Extracts video metadata for several files concurrently.
+    
+    FFprobe startup dominates probing time for most files, so probes are
+    run in parallel threads (one ffprobe process each).
+    
+    Args:
+        file_paths: Paths to the video files
+        
+    Returns:
+        VideoMetadata objects in the same order as file_paths
+        
+    Raises:
+        FileNotFoundError: If any file doesn't exist
+        RuntimeError: If FFprobe fails to parse any file
+    """
+    if len(file_paths) <= 1:
+        return [get_video_metadata(path) for path in file_paths]
+    
+    workers = min(len(file_paths), os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(get_video_metadata, file_paths))
+
+
 def get_audio_metadata(file_path: str) -> Optional[AudioMetadata]:
     """
     Extracts audio metadata using FFprobe.
@@ -188,11 +359,10 @@ def get_audio_metadata(file_path: str) -> Optional[AudioMetadata]:
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+            creationflags=_CREATION_FLAGS
         )
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout)
     except (subprocess.CalledProcessError, json.JSONDecodeError):
         return None
     
@@ -210,36 +380,28 @@ def get_audio_metadata(file_path: str) -> Optional[AudioMetadata]:
     )
 
 
-def extract_frame(
+def _build_extract_frame_cmd(
     file_path: str,
     time_seconds: float,
     output_path: str,
     width: Optional[int] = None,
-    height: Optional[int] = None
-) -> bool:
-    """
-    Extracts a single frame from a video at the specified time.
-    
-    Args:
-        file_path: Path to source video
-        time_seconds: Time position in seconds
-        output_path: Path for output image (jpg/png)
-        width: Optional resize width
-        height: Optional resize height
-        
-    Returns:
-        True if successful, False otherwise
-    """
+    height: Optional[int] = None,
+    keyframe_only: bool = True
+) -> List[str]:
+    """Builds the FFmpeg command for extract_frame()."""
     ffmpeg = get_ffmpeg_path()
     
-    cmd = [
-        ffmpeg,
-        "-y",  # Overwrite output
+    cmd = [ffmpeg, *_QUIET_ARGS, "-y"]  # Overwrite output
+    if keyframe_only:
+        # Decode only keyframes and take the one at/before the seek point
+        cmd.extend(["-skip_frame", "nokey", "-noaccurate_seek"])
+    cmd.extend([
         "-ss", str(time_seconds),  # Seek before input (fast)
         "-i", file_path,
+        "-vsync", "vfr",
         "-vframes", "1",  # Extract one frame
         "-q:v", "2",  # High quality
-    ]
+    ])
     
     # Add scaling if specified
     if width and height:
@@ -251,96 +413,135 @@ def extract_frame(
     
     cmd.append(output_path)
     
-    try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
-        return False
+    return cmd
 
 
-def generate_proxy(
-    input_path: str,
+def extract_frame(
+    file_path: str,
+    time_seconds: float,
     output_path: str,
-    width: int = 640,
-    quality: int = 28
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    keyframe_only: bool = True
 ) -> bool:
     """
-    Generates a low-resolution proxy video for faster playback.
+    Extracts a single frame from a video at the specified time.
     
     Args:
-        input_path: Path to source video
-        output_path: Path for proxy video
-        width: Target width (height auto-calculated)
-        quality: CRF quality (higher = smaller file, lower quality)
+        file_path: Path to source video
+        time_seconds: Time position in seconds
+        output_path: Path for output image (jpg/png)
+        width: Optional resize width
+        height: Optional resize height
+        keyframe_only: Use the nearest keyframe at/before time_seconds, which
+            skips decoding inter frames (much faster on long GOPs, fine for
+            thumbnails). Pass False for the exact frame.
         
     Returns:
         True if successful, False otherwise
     """
+    cmd = _build_extract_frame_cmd(file_path, time_seconds, output_path, width, height, keyframe_only)
+    return _run(cmd, output_path)
+
+
+async def extract_frame_async(
+    file_path: str,
+    time_seconds: float,
+    output_path: str,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    keyframe_only: bool = True
+) -> bool:
+    """Async version of extract_frame(), usable with asyncio.gather."""
+    cmd = _build_extract_frame_cmd(file_path, time_seconds, output_path, width, height, keyframe_only)
+    return await _run_async(cmd, output_path)
+
+
+def _build_generate_proxy_cmd(
+    input_path: str,
+    output_path: str,
+    width: int = 640,
+    quality: int = 28,
+    use_hw_encoder: bool = True
+) -> List[str]:
+    """Builds the FFmpeg command for generate_proxy()."""
     ffmpeg = get_ffmpeg_path()
     
     cmd = [
         ffmpeg,
+        *_QUIET_ARGS,
         "-y",
         "-i", input_path,
         "-vf", f"scale={width}:-2",  # -2 ensures even height
-        "-c:v", "libx264",
-        "-preset", "ultrafast",
-        "-crf", str(quality),
+        *h264_encoder_args(quality, fast=True, use_hw=use_hw_encoder),
         "-c:a", "aac",
         "-b:a", "128k",
         output_path
     ]
     
-    try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
-        return False
+    return cmd
 
 
-def trim_video(
+def generate_proxy(
     input_path: str,
     output_path: str,
-    start_time: float,
-    end_time: float,
-    reencode: bool = False
+    width: int = 640,
+    quality: int = 28,
+    use_hw_encoder: bool = True
 ) -> bool:
     """
-    Trims a video to the specified time range.
+    Generates a low-resolution proxy video for faster playback.
     
     Args:
         input_path: Path to source video
-        output_path: Path for trimmed video
-        start_time: Start time in seconds
-        end_time: End time in seconds
-        reencode: If True, re-encodes video (slower but frame-accurate)
+        output_path: Path for proxy video
+        width: Target width (height auto-calculated)
+        quality: CRF quality (higher = smaller file, lower quality)
+        use_hw_encoder: Encode on the GPU when a hardware encoder is available
         
     Returns:
         True if successful, False otherwise
     """
+    cmd = _build_generate_proxy_cmd(input_path, output_path, width, quality, use_hw_encoder)
+    return _run(cmd, output_path)
+
+
+async def generate_proxy_async(
+    input_path: str,
+    output_path: str,
+    width: int = 640,
+    quality: int = 28,
+    use_hw_encoder: bool = True
+) -> bool:
+    """Async version of generate_proxy(), usable with asyncio.gather."""
+    # Building may probe hardware encoders (blocking, first call only)
+    cmd = await asyncio.to_thread(
+        _build_generate_proxy_cmd, input_path, output_path, width, quality, use_hw_encoder
+    )
+    return await _run_async(cmd, output_path)
+
+
+def _build_trim_video_cmd(
+    input_path: str,
+    output_path: str,
+    start_time: float,
+    end_time: float,
+    reencode: bool = False,
+    use_hw_encoder: bool = True
+) -> List[str]:
+    """Builds the FFmpeg command for trim_video()."""
     ffmpeg = get_ffmpeg_path()
     duration = end_time - start_time
     
     if reencode:
         cmd = [
             ffmpeg,
+            *_QUIET_ARGS,
             "-y",
             "-i", input_path,
             "-ss", str(start_time),
             "-t", str(duration),
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "18",
+            *h264_encoder_args(18, use_hw=use_hw_encoder),
             "-c:a", "aac",
             "-b:a", "192k",
             output_path
@@ -349,6 +550,7 @@ def trim_video(
         # Stream copy (fast but may have keyframe issues)
         cmd = [
             ffmpeg,
+            *_QUIET_ARGS,
             "-y",
             "-ss", str(start_time),
             "-i", input_path,
@@ -358,16 +560,69 @@ def trim_video(
             output_path
         ]
     
+    return cmd
+
+
+def trim_video(
+    input_path: str,
+    output_path: str,
+    start_time: float,
+    end_time: float,
+    reencode: bool = False,
+    use_hw_encoder: bool = True
+) -> bool:
+    """
+    Trims a video to the specified time range.
+    
+    Args:
+        input_path: Path to source video
+        output_path: Path for trimmed video
+        start_time: Start time in seconds
+        end_time: End time in seconds
+        reencode: If True, re-encodes video (slower but frame-accurate)
+        use_hw_encoder: When re-encoding, use a hardware encoder if available
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    cmd = _build_trim_video_cmd(input_path, output_path, start_time, end_time, reencode, use_hw_encoder)
+    return _run(cmd, output_path)
+
+
+async def trim_video_async(
+    input_path: str,
+    output_path: str,
+    start_time: float,
+    end_time: float,
+    reencode: bool = False,
+    use_hw_encoder: bool = True
+) -> bool:
+    """Async version of trim_video(), usable with asyncio.gather."""
+    # Building may probe hardware encoders (blocking, first call only)
+    cmd = await asyncio.to_thread(
+        _build_trim_video_cmd,
+        input_path, output_path, start_time, end_time, reencode, use_hw_encoder
+    )
+    return await _run_async(cmd, output_path)
+
+
+def _can_stream_copy_concat(input_files: List[str]) -> bool:
+    """
+    Checks whether inputs share video and audio parameters, so the concat
+    demuxer can join them with stream copy instead of re-encoding.
+    """
     try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
+        videos = get_video_metadata_many(input_files)
+        audios = [get_audio_metadata(path) for path in input_files]
+    except (FileNotFoundError, RuntimeError):
+        return False
+    
+    if any(audio is None for audio in audios):
         return False
+    
+    video_params = {(v.codec, v.width, v.height, round(v.fps, 3), v.rotation) for v in videos}
+    audio_params = {(a.codec, a.sample_rate, a.channels) for a in audios}
+    return len(video_params) == 1 and len(audio_params) == 1
 
 
 def concat_videos(
@@ -381,7 +636,9 @@ def concat_videos(
     Args:
         input_files: List of input video paths
         output_path: Path for output video
-        reencode: If True, re-encodes (required if videos have different properties)
+        reencode: If True, re-encodes (required if videos have different properties).
+            Ignored when all inputs share codecs, resolution and frame rate,
+            as stream copy then gives the same result much faster.
         
     Returns:
         True if successful, False otherwise
@@ -396,6 +653,9 @@ def concat_videos(
     
     ffmpeg = get_ffmpeg_path()
     
+    if reencode and _can_stream_copy_concat(input_files):
+        reencode = False
+    
     if reencode:
         # Use filter_complex for re-encoding
         filter_inputs = ""
@@ -404,7 +664,7 @@ def concat_videos(
             filter_concat += f"[{i}:v][{i}:a]"
         filter_concat += f"concat=n={len(input_files)}:v=1:a=1[outv][outa]"
         
-        cmd = [ffmpeg, "-y"]
+        cmd = [ffmpeg, *_QUIET_ARGS, "-y"]
         for f in input_files:
             cmd.extend(["-i", f])
         cmd.extend([
@@ -430,6 +690,7 @@ def concat_videos(
         
         cmd = [
             ffmpeg,
+            *_QUIET_ARGS,
             "-y",
             "-f", "concat",
             "-safe", "0",
@@ -438,43 +699,99 @@ def concat_videos(
             output_path
         ]
     
-    try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
-        return False
+    return _run(cmd, output_path)
 
 
-def mix_audio(
-    video_path: str,
-    audio_files: List[Tuple[str, float, float]],  # (path, start_time, volume)
-    output_path: str
+def _build_trim_and_concat_cmd(
+    input_path: str,
+    segments: List[Tuple[float, float]],
+    output_path: str,
+    use_hw_encoder: bool = True
+) -> List[str]:
+    """Builds the FFmpeg command for trim_and_concat()."""
+    ffmpeg = get_ffmpeg_path()
+    
+    filter_parts = []
+    concat_inputs = ""
+    for i, (start, end) in enumerate(segments):
+        filter_parts.append(f"[0:v]trim=start={start}:end={end},setpts=PTS-STARTPTS[v{i}]")
+        filter_parts.append(f"[0:a]atrim=start={start}:end={end},asetpts=PTS-STARTPTS[a{i}]")
+        concat_inputs += f"[v{i}][a{i}]"
+    filter_parts.append(f"{concat_inputs}concat=n={len(segments)}:v=1:a=1[outv][outa]")
+    
+    cmd = [
+        ffmpeg,
+        *_QUIET_ARGS,
+        "-y",
+        "-i", input_path,
+        "-filter_complex", ";".join(filter_parts),
+        "-map", "[outv]",
+        "-map", "[outa]",
+        *h264_encoder_args(18, use_hw=use_hw_encoder),
+        "-c:a", "aac",
+        "-b:a", "192k",
+        output_path
+    ]
+    
+    return cmd
+
+
+def trim_and_concat(
+    input_path: str,
+    segments: List[Tuple[float, float]],
+    output_path: str,
+    use_hw_encoder: bool = True
 ) -> bool:
     """
-    Mixes additional audio tracks into a video.
+    Cuts several ranges from one video and joins them, in a single pass.
+    
+    Equivalent to trim_video() per segment followed by concat_videos(),
+    but trims and concatenation run in one filter graph, so no
+    intermediate files are written and read back.
     
     Args:
-        video_path: Path to source video
-        audio_files: List of (audio_path, start_time, volume) tuples
+        input_path: Path to source video
+        segments: List of (start_time, end_time) tuples in seconds, in output order
         output_path: Path for output video
+        use_hw_encoder: Use a hardware encoder if one is available
         
     Returns:
         True if successful, False otherwise
     """
-    if not audio_files:
-        # No audio to mix, just copy
-        shutil.copy2(video_path, output_path)
-        return True
+    if not segments:
+        return False
+    
+    cmd = _build_trim_and_concat_cmd(input_path, segments, output_path, use_hw_encoder)
+    return _run(cmd, output_path)
+
+
+async def trim_and_concat_async(
+    input_path: str,
+    segments: List[Tuple[float, float]],
+    output_path: str,
+    use_hw_encoder: bool = True
+) -> bool:
+    """Async version of trim_and_concat(), usable with asyncio.gather."""
+    if not segments:
+        return False
     
+    # Building may probe hardware encoders (blocking, first call only)
+    cmd = await asyncio.to_thread(
+        _build_trim_and_concat_cmd, input_path, segments, output_path, use_hw_encoder
+    )
+    return await _run_async(cmd, output_path)
+
+
+def _build_mix_audio_cmd(
+    video_path: str,
+    audio_files: List[Tuple[str, float, float]],  # (path, start_time, volume)
+    output_path: str
+) -> List[str]:
+    """Builds the FFmpeg command for mix_audio()."""
     ffmpeg = get_ffmpeg_path()
     
     # Build filter complex for audio mixing
-    cmd = [ffmpeg, "-y", "-i", video_path]
+    cmd = [ffmpeg, *_QUIET_ARGS, "-y", "-i", video_path]
     
     filter_parts = []
     audio_inputs = []
@@ -508,44 +825,61 @@ def mix_audio(
         output_path
     ])
     
-    try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
-        return False
+    return cmd
 
 
-def burn_subtitles(
+def mix_audio(
     video_path: str,
-    srt_path: str,
-    output_path: str,
-    font_name: str = "Arial",
-    font_size: int = 24,
-    font_color: str = "white",
-    outline_color: str = "black",
-    outline_width: int = 2
+    audio_files: List[Tuple[str, float, float]],  # (path, start_time, volume)
+    output_path: str
 ) -> bool:
     """
-    Burns SRT subtitles into a video.
+    Mixes additional audio tracks into a video.
     
     Args:
         video_path: Path to source video
-        srt_path: Path to SRT subtitle file
+        audio_files: List of (audio_path, start_time, volume) tuples
         output_path: Path for output video
-        font_name: Font family name
-        font_size: Font size in points
-        font_color: Font color (name or hex)
-        outline_color: Outline color
-        outline_width: Outline thickness
         
     Returns:
         True if successful, False otherwise
     """
+    if not audio_files:
+        # No audio to mix, just copy
+        shutil.copy2(video_path, output_path)
+        return True
+    
+    cmd = _build_mix_audio_cmd(video_path, audio_files, output_path)
+    return _run(cmd, output_path)
+
+
+async def mix_audio_async(
+    video_path: str,
+    audio_files: List[Tuple[str, float, float]],  # (path, start_time, volume)
+    output_path: str
+) -> bool:
+    """Async version of mix_audio(), usable with asyncio.gather."""
+    if not audio_files:
+        # No audio to mix, just copy (off the event loop)
+        await asyncio.to_thread(shutil.copy2, video_path, output_path)
+        return True
+    
+    cmd = _build_mix_audio_cmd(video_path, audio_files, output_path)
+    return await _run_async(cmd, output_path)
+
+
+def _build_burn_subtitles_cmd(
+    video_path: str,
+    srt_path: str,
+    output_path: str,
+    font_name: str = "Arial",
+    font_size: int = 24,
+    font_color: str = "white",
+    outline_color: str = "black",
+    outline_width: int = 2,
+    use_hw_encoder: bool = True
+) -> List[str]:
+    """Builds the FFmpeg command for burn_subtitles()."""
     ffmpeg = get_ffmpeg_path()
     
     # Escape path for subtitle filter (Windows paths need special handling)
@@ -565,26 +899,72 @@ def burn_subtitles(
     
     cmd = [
         ffmpeg,
+        *_QUIET_ARGS,
         "-y",
         "-i", video_path,
         "-vf", subtitle_filter,
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "18",
+        *h264_encoder_args(18, use_hw=use_hw_encoder),
         "-c:a", "copy",
         output_path
     ]
     
-    try:
-        subprocess.run(
-            cmd,
-            capture_output=True,
-            check=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
-        )
-        return os.path.exists(output_path)
-    except subprocess.CalledProcessError:
-        return False
+    return cmd
+
+
+def burn_subtitles(
+    video_path: str,
+    srt_path: str,
+    output_path: str,
+    font_name: str = "Arial",
+    font_size: int = 24,
+    font_color: str = "white",
+    outline_color: str = "black",
+    outline_width: int = 2,
+    use_hw_encoder: bool = True
+) -> bool:
+    """
+    Burns SRT subtitles into a video.
+    
+    Args:
+        video_path: Path to source video
+        srt_path: Path to SRT subtitle file
+        output_path: Path for output video
+        font_name: Font family name
+        font_size: Font size in points
+        font_color: Font color (name or hex)
+        outline_color: Outline color
+        outline_width: Outline thickness
+        use_hw_encoder: Use a hardware encoder if one is available
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    cmd = _build_burn_subtitles_cmd(
+        video_path, srt_path, output_path, font_name, font_size,
+        font_color, outline_color, outline_width, use_hw_encoder
+    )
+    return _run(cmd, output_path)
+
+
+async def burn_subtitles_async(
+    video_path: str,
+    srt_path: str,
+    output_path: str,
+    font_name: str = "Arial",
+    font_size: int = 24,
+    font_color: str = "white",
+    outline_color: str = "black",
+    outline_width: int = 2,
+    use_hw_encoder: bool = True
+) -> bool:
+    """Async version of burn_subtitles(), usable with asyncio.gather."""
+    # Building may probe hardware encoders (blocking, first call only)
+    cmd = await asyncio.to_thread(
+        _build_burn_subtitles_cmd,
+        video_path, srt_path, output_path, font_name, font_size,
+        font_color, outline_color, outline_width, use_hw_encoder
+    )
+    return await _run_async(cmd, output_path)
 
 
 def get_video_duration(file_path: str) -> float:
@@ -602,3 +982,48 @@ def get_video_duration(file_path: str) -> float:
         return metadata.duration
     except Exception:
         return 0.0
+
+
+def get_keyframe_times(file_path: str) -> List[float]:
+    """
+    Lists keyframe timestamps of the first video stream.
+    
+    Reads packet flags only (no decoding), so this is fast even for
+    long files.
+    
+    Args:
+        file_path: Path to video file
+        
+    Returns:
+        Sorted keyframe times in seconds (empty on failure)
+    """
+    ffprobe = get_ffprobe_path()
+    
+    cmd = [
+        ffprobe,
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        file_path
+    ]
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            check=True,
+            creationflags=_CREATION_FLAGS
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return []
+    
+    times = []
+    for line in result.stdout.splitlines():
+        pts, _, flags = line.partition(",")
+        if "K" in flags and pts not in ("", "N/A"):
+            times.append(float(pts))
+    
+    times.sort()
+    return times
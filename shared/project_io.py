@@ -5,25 +5,116 @@ Handles serialization and deserialization of Manual Editor projects.
 Projects are saved as JSON files with a .lcproj extension.
 """
 
+import io
 import json
+import mmap
 import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 if TYPE_CHECKING:
     from manual_editor.models.project import Project
 
 # Project file version for migration support
 PROJECT_VERSION = "1.0.0"
 
+# Binary (MessagePack) project files start with this; JSON ones never do
+MSGPACK_MAGIC = b"LCMP"
+
+# The process umask, read once at import: reading it means setting it, which
+# must not happen later while other threads may be creating files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Write buffer for SRT export (amortizes syscalls over many small cues)
+SRT_BUFFER_SIZE = 256 * 1024
+
+
+def _dumps(data, pretty: bool = False) -> bytes:
+    """Serializes to UTF-8 JSON (compact, or indented if pretty), with orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(raw):
+    """Parses UTF-8 JSON bytes or a memoryview, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+
+@contextmanager
+def _atomic_writer(file_path: str):
+    """
+    Opens a binary temp file beside file_path that replaces it on success.
+    
+    The data is fsynced before the rename, so a crash mid-save leaves
+    the previous file intact instead of a truncated one. On error the
+    temp file is removed and the exception propagates.
+    """
+    directory = os.path.dirname(file_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    
+    tmp = tempfile.NamedTemporaryFile('wb', dir=directory, prefix=".lcproj-", delete=False)
+    try:
+        with tmp:
+            yield tmp
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, tmp.name)
+        else:
+            # NamedTemporaryFile creates 0600; give new files the usual umask mode
+            os.chmod(tmp.name, 0o666 & ~_UMASK)
+        os.replace(tmp.name, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp.name)
+        except OSError:
+            pass
+        raise
+
 
-def save_project(project: "Project", file_path: str) -> bool:
+def save_project(
+    project: "Project",
+    file_path: str,
+    pretty: bool = False,
+    binary: bool = False
+) -> bool:
     """
     Saves a project to a JSON file.
     
     Args:
         project: The Project object to save
         file_path: Destination file path (.lcproj)
+        pretty: Indent the JSON for human reading (larger and slower;
+            the app itself reads either form)
+        binary: Write MessagePack instead of JSON (smaller and faster;
+            needs the msgpack package, and older versions can't read it)
         
     Returns:
         True if successful, False otherwise
@@ -35,11 +126,74 @@ def save_project(project: "Project", file_path: str) -> bool:
             "project": project.to_dict()
         }
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        if binary:
+            if msgpack is None:
+                raise ImportError("msgpack is required for binary project files")
+            payload = MSGPACK_MAGIC + msgpack.packb(data, use_bin_type=True)
+        else:
+            payload = _dumps(data, pretty)
+        with _atomic_writer(file_path) as f:
+            f.write(payload)
+        
+        return True
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        print(f"Failed to save project: {e}")
+        return False
+
+
+def _write_array(f, items) -> None:
+    """Writes items as a JSON array, serializing one element at a time."""
+    f.write(b'[')
+    for i, item in enumerate(items):
+        if i:
+            f.write(b',')
+        f.write(_dumps(item.to_dict()))
+    f.write(b']')
+
+
+def save_project_streaming(project: "Project", file_path: str) -> bool:
+    """
+    Saves a project like save_project(), without building the whole
+    project dict first.
+    
+    Clips and subtitles are serialized and written one at a time, so
+    peak memory stays flat for very large projects. The output is
+    compact (not indented) JSON in the same format, readable by
+    load_project().
+    
+    Args:
+        project: The Project object to save
+        file_path: Destination file path (.lcproj)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with _atomic_writer(file_path) as f:
+            f.write(b'{"version":%s,"saved_at":%s,"project":{"id":%s,"name":%s' % (
+                _dumps(PROJECT_VERSION),
+                _dumps(datetime.now().isoformat()),
+                _dumps(project.id),
+                _dumps(project.name)
+            ))
+            
+            for key, tracks in ((b"video_tracks", project.video_tracks),
+                                (b"audio_tracks", project.audio_tracks)):
+                f.write(b',"%s":[' % key)
+                for i, track in enumerate(tracks):
+                    if i:
+                        f.write(b',')
+                    _write_array(f, track)
+                f.write(b']')
+            
+            f.write(b',"subtitles":')
+            _write_array(f, project.subtitles)
+            
+            f.write(b',"settings":%s,"media_pool":%s}}' % (
+                _dumps(project.settings.to_dict()),
+                _dumps(project.media_pool)
+            ))
         
         return True
         
@@ -50,7 +204,7 @@ def save_project(project: "Project", file_path: str) -> bool:
 
 def load_project(file_path: str) -> "Project":
     """
-    Loads a project from a JSON file.
+    Loads a project from a JSON or MessagePack file.
     
     Args:
         file_path: Path to the .lcproj file
@@ -68,11 +222,29 @@ def load_project(file_path: str) -> "Project":
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Project file not found: {file_path}")
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid project file format: {e}")
+    with open(file_path, 'rb') as f:
+        try:
+            # Parse straight from the page cache instead of copying into bytes
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap rejects empty files
+            mm = None
+            raw = memoryview(f.read())
+        else:
+            raw = memoryview(mm)
+        
+        try:
+            if raw[:len(MSGPACK_MAGIC)] == MSGPACK_MAGIC:
+                if msgpack is None:
+                    raise ValueError("binary project files need the msgpack package")
+                data = msgpack.unpackb(raw[len(MSGPACK_MAGIC):], raw=False)
+            else:
+                data = _loads(raw)
+        except ValueError as e:  # JSON and msgpack decode errors subclass this
+            raise ValueError(f"Invalid project file format: {e}")
+        finally:
+            raw.release()
+            if mm is not None:
+                mm.close()
     
     # Version check for future migrations
     version = data.get("version", "0.0.0")
@@ -114,20 +286,20 @@ def export_srt(subtitles: list, output_path: str) -> bool:
         True if successful, False otherwise
     """
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            for i, sub in enumerate(subtitles, start=1):
-                # SRT format:
-                # 1
-                # 00:00:01,000 --> 00:00:04,000
-                # Subtitle text
-                
-                start = _seconds_to_srt_time(sub.start_time)
-                end = _seconds_to_srt_time(sub.start_time + sub.duration)
-                
-                f.write(f"{i}\n")
-                f.write(f"{start} --> {end}\n")
-                f.write(f"{sub.text}\n")
-                f.write("\n")
+        # SRT format:
+        # 1
+        # 00:00:01,000 --> 00:00:04,000
+        # Subtitle text
+        #
+        # One formatted cue per write, into a large buffer over the raw file
+        starts = _seconds_to_srt_batch([sub.start_time for sub in subtitles])
+        ends = _seconds_to_srt_batch([sub.start_time + sub.duration for sub in subtitles])
+        
+        with io.BufferedWriter(io.FileIO(output_path, 'w'), buffer_size=SRT_BUFFER_SIZE) as f:
+            f.writelines(
+                f"{i}\n{start} --> {end}\n{sub.text}\n\n".encode('utf-8')
+                for i, (sub, start, end) in enumerate(zip(subtitles, starts, ends), start=1)
+            )
         
         return True
         
@@ -146,9 +318,113 @@ def _seconds_to_srt_time(seconds: float) -> str:
     Returns:
         Formatted timestamp string
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    # Same rounding as _seconds_to_srt_batch, so output doesn't depend on NumPy
+    total_ms = round(seconds * 1000)
+    hours = total_ms // 3_600_000
+    minutes = (total_ms // 60_000) % 60
+    secs = (total_ms // 1000) % 60
+    millis = total_ms % 1000
     
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+# Width of one "HH:MM:SS,mmm" stamp
+SRT_STAMP_WIDTH = 12
+
+def _srt_stamps_loop(total_ms, out):
+    """
+    Writes each millisecond count as ASCII HH:MM:SS,mmm into a row of out.
+    Compiled with Numba by _get_srt_stamps_kernel().
+    """
+    zero = 48  # ord("0")
+    for i in range(total_ms.shape[0]):
+        ms = total_ms[i]
+        hours = ms // 3_600_000
+        minutes = (ms // 60_000) % 60
+        secs = (ms // 1000) % 60
+        millis = ms % 1000
+        row = out[i]
+        row[0] = zero + hours // 10
+        row[1] = zero + hours % 10
+        row[2] = 58  # ":"
+        row[3] = zero + minutes // 10
+        row[4] = zero + minutes % 10
+        row[5] = 58
+        row[6] = zero + secs // 10
+        row[7] = zero + secs % 10
+        row[8] = 44  # ","
+        row[9] = zero + millis // 100
+        row[10] = zero + (millis // 10) % 10
+        row[11] = zero + millis % 10
+
+
+# Numba-compiled _srt_stamps_loop: None until first needed, False if numba
+# is missing or failed (e.g. in a frozen build). numba is imported here
+# rather than at module load, so loading/saving projects doesn't pay for it
+_srt_stamps_kernel = None
+
+
+def _get_srt_stamps_kernel():
+    """Gets the compiled stamp kernel, or None to use the NumPy formatter."""
+    global _srt_stamps_kernel
+    if _srt_stamps_kernel is None:
+        try:
+            from numba import njit
+            _srt_stamps_kernel = njit(nogil=True)(_srt_stamps_loop)
+        except Exception:
+            _srt_stamps_kernel = False
+    return _srt_stamps_kernel or None
+
+
+def _seconds_to_srt_batch(seconds: list) -> list:
+    """
+    Converts many times to SRT timestamps at once.
+    
+    Uses a Numba kernel that writes the digits straight into a byte
+    buffer when Numba is installed and the kernel compiles (numba is
+    imported on the first call), vectorized NumPy arithmetic and
+    string ops when only NumPy is, otherwise _seconds_to_srt_time per
+    value.
+    
+    Args:
+        seconds: Times in seconds
+        
+    Returns:
+        List of formatted timestamp strings
+    """
+    global _srt_stamps_kernel
+    if np is None or not seconds:
+        return [_seconds_to_srt_time(t) for t in seconds]
+    
+    # np.rint rounds half to even, like round() in _seconds_to_srt_time
+    total_ms = np.rint(np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    
+    # The compiled kernel emits two hour digits, so it covers anything under 100h
+    if 0 <= total_ms.min() and total_ms.max() < 360_000_000:
+        kernel = _get_srt_stamps_kernel()
+        if kernel is not None:
+            out = np.empty((len(total_ms), SRT_STAMP_WIDTH), dtype=np.uint8)
+            try:
+                kernel(total_ms, out)  # Compiles on the first call
+            except Exception:
+                # Don't retry a kernel that can't compile; use NumPy from now on
+                _srt_stamps_kernel = False
+            else:
+                raw = out.tobytes().decode('ascii')
+                return [raw[i:i + SRT_STAMP_WIDTH] for i in range(0, len(raw), SRT_STAMP_WIDTH)]
+    
+    hours = total_ms // 3_600_000
+    minutes = (total_ms // 60_000) % 60
+    secs = (total_ms // 1000) % 60
+    millis = total_ms % 1000
+    
+    def pad(values, width):
+        return np.char.zfill(values.astype(str), width)
+    
+    stamps = np.char.add(pad(hours, 2), ":")
+    stamps = np.char.add(stamps, pad(minutes, 2))
+    stamps = np.char.add(stamps, ":")
+    stamps = np.char.add(stamps, pad(secs, 2))
+    stamps = np.char.add(stamps, ",")
+    stamps = np.char.add(stamps, pad(millis, 3))
+    return stamps.tolist()
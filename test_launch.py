@@ -1,27 +1,36 @@
 import sys
 import os
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party packages, imported concurrently so their disk reads overlap.
+# core and config import these themselves, so they are loaded afterwards.
+PACKAGES = ["customtkinter", "moviepy.editor", "whisper", "google.generativeai"]
 
 print("Testing imports...")
+current = None
 try:
-    import customtkinter
-    print("✅ customtkinter loaded")
-    import moviepy.editor
-    print("✅ moviepy loaded")
-    import whisper
-    print("✅ whisper loaded")
-    import google.generativeai
-    print("✅ google.generativeai loaded")
+    with ThreadPoolExecutor(max_workers=len(PACKAGES)) as ex:
+        futures = {name: ex.submit(importlib.import_module, name) for name in PACKAGES}
+    for name, future in futures.items():
+        current = name
+        future.result()
+        print(f"✅ {name} loaded")
+    
+    current = "core"
     from core import LazyCutCore
     print("✅ core module loaded")
+    current = "config"
     from config import IS_WINDOWS
     print(f"✅ config loaded (Windows: {IS_WINDOWS})")
     
     # Try initializing core (lightweight check)
+    current = "core initialization"
     core = LazyCutCore()
     print("✅ Core initialized")
     
     print("ALL CHECKS PASSED")
     sys.exit(0)
 except Exception as e:
-    print(f"❌ IMPORT ERROR: {e}")
+    print(f"❌ IMPORT ERROR ({current}): {e}")
     sys.exit(1)
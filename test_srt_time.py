@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from shared import project_io
+from shared.project_io import _seconds_to_srt_batch, _seconds_to_srt_time
+
+# Fractional times that used to round differently with and without NumPy
+SAMPLES = [0.0, 0.0005, 0.001, 1.999, 56.62, 59.9995, 3599.999, 3600.0, 86399.9996]
+_rng = random.Random(0)
+SAMPLES += [round(_rng.uniform(0, 36000), 3) for _ in range(500)]
+
+
+def test_scalar_examples():
+    assert _seconds_to_srt_time(56.62) == "00:00:56,620"
+    assert _seconds_to_srt_time(3661.5) == "01:01:01,500"
+    assert _seconds_to_srt_time(59.9996) == "00:01:00,000"
+
+
+def test_numpy_matches_scalar(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(project_io, "_srt_stamps_kernel", False)
+    assert _seconds_to_srt_batch(SAMPLES) == [_seconds_to_srt_time(t) for t in SAMPLES]
+
+
+def test_numba_matches_scalar(monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(project_io, "_srt_stamps_kernel", None)
+    assert _seconds_to_srt_batch(SAMPLES) == [_seconds_to_srt_time(t) for t in SAMPLES]
+    assert project_io._srt_stamps_kernel
+
+
+def test_numba_failure_falls_back_to_numpy(monkeypatch):
+    pytest.importorskip("numpy")
+    
+    def broken_kernel(total_ms, out):
+        raise RuntimeError("cannot compile")
+    
+    monkeypatch.setattr(project_io, "_srt_stamps_kernel", broken_kernel)
+    assert _seconds_to_srt_batch(SAMPLES) == [_seconds_to_srt_time(t) for t in SAMPLES]
+    assert project_io._srt_stamps_kernel is False
+
+
+def test_fallback_matches_scalar(monkeypatch):
+    monkeypatch.setattr(project_io, "np", None)
+    assert _seconds_to_srt_batch(SAMPLES) == [_seconds_to_srt_time(t) for t in SAMPLES]
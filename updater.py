@@ -1,42 +1,132 @@
 import os
 import sys
+import json
+import hashlib
 import requests
 import logging
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from packaging import version
 from config import VERSION, GITHUB_REPO, TEMP_DIR, IS_WINDOWS
 
 logger = logging.getLogger('LazyCut.Updater')
 
+# Installer download: parallel ranged GETs of DOWNLOAD_PART_SIZE each
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+RANGE_ATTEMPTS = 3
+
+# One keep-alive session for the update check and the download
+# (API host + asset host, one connection per download worker)
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=DOWNLOAD_WORKERS))
+
+# Last release seen (ETag, tag, asset URL and its published SHA-256), so repeat checks
+# within UPDATE_CHECK_INTERVAL skip the network and later ones can get a 304
+UPDATE_STATE_FILE = os.path.join(TEMP_DIR, ".update_state.json")
+UPDATE_CHECK_INTERVAL = 3600  # seconds
+
+def _load_update_state():
+    try:
+        with open(UPDATE_STATE_FILE, 'rb') as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+
+def _save_update_state(state):
+    try:
+        os.makedirs(TEMP_DIR, exist_ok=True)
+        with open(UPDATE_STATE_FILE, 'wb') as f:
+            f.write(json.dumps(state, separators=(',', ':')).encode('utf-8'))
+    except OSError as e:
+        logger.debug(f"Could not cache update state: {e}")
+
+def _update_state_age():
+    try:
+        return time.time() - os.path.getmtime(UPDATE_STATE_FILE)
+    except OSError:
+        return float("inf")
+
+def _find_asset(data):
+    """Finds the correct asset for this platform in a release."""
+    asset_name_filter = ".exe" if IS_WINDOWS else ".AppImage" # Example filter
+    for asset in data.get("assets", []):
+        if asset_name_filter in asset["name"]:
+            return asset
+    return None
+
+def _find_checksum_url(data, asset_name):
+    """Finds a published "<asset>.sha256" checksum file for an asset, if any."""
+    for asset in data.get("assets", []):
+        if asset["name"] == f"{asset_name}.sha256":
+            return asset["browser_download_url"]
+    return None
+
+def _fetch_checksum(checksum_url):
+    """Reads the hex digest from a sha256sum-style checksum file."""
+    response = _SESSION.get(checksum_url, timeout=10)
+    response.raise_for_status()
+    fields = response.text.split()
+    return fields[0].lower() if fields else None
+
+def _sha256_file(path):
+    """SHA-256 of a file (hashlib uses OpenSSL, with SHA-NI where the CPU has it)."""
+    digest = hashlib.sha256()
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
 def check_for_updates():
     """
     Checks GitHub for a newer release.
     Returns (bool, str, str): (update_available, latest_version, download_url)
     """
     try:
-        url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
-        response = requests.get(url, timeout=5)
-        if response.status_code == 404:
-            logger.warning("GitHub release not found (Repo might be private).")
-            return False, None, None
-        response.raise_for_status()
+        state = _load_update_state()
         
-        data = response.json()
-        latest_tag = data.get("tag_name", "v0.0.0").lstrip("v")
+        if "tag_name" in state and _update_state_age() < UPDATE_CHECK_INTERVAL:
+            # Checked recently; reuse that answer
+            latest_tag = state["tag_name"]
+            download_url = state.get("download_url")
+        else:
+            url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+            headers = {"If-None-Match": state["etag"]} if state.get("etag") else {}
+            
+            response = _SESSION.get(url, headers=headers, timeout=5)
+            if response.status_code == 404:
+                logger.warning("GitHub release not found (Repo might be private).")
+                return False, None, None
+            
+            if response.status_code != 304 or "tag_name" not in state:
+                response.raise_for_status()
+                data = response.json()
+                asset = _find_asset(data) or {}
+                # GitHub reports asset digests as "sha256:<hex>"
+                digest = asset.get("digest") or ""
+                state = {
+                    "etag": response.headers.get("ETag"),
+                    "tag_name": data.get("tag_name", "v0.0.0").lstrip("v"),
+                    "download_url": asset.get("browser_download_url"),
+                    "sha256": digest[len("sha256:"):] if digest.startswith("sha256:") else None,
+                    "sha256_url": _find_checksum_url(data, asset["name"]) if asset else None,
+                }
+            # Rewritten on 304 too, restarting the check interval
+            _save_update_state(state)
+            latest_tag = state["tag_name"]
+            download_url = state.get("download_url")
         
         if version.parse(latest_tag) > version.parse(VERSION):
             logger.info(f"New version available: {latest_tag} (Current: {VERSION})")
-            
-            # Find the correct asset
-            download_url = None
-            asset_name_filter = ".exe" if IS_WINDOWS else ".AppImage" # Example filter
-            
-            for asset in data.get("assets", []):
-                if asset_name_filter in asset["name"]:
-                    download_url = asset["browser_download_url"]
-                    break
-            
             return True, latest_tag, download_url
         else:
             logger.info("App is up to date.")
@@ -46,23 +136,152 @@ def check_for_updates():
         logger.error(f"Update check failed: {e}")
         return False, None, None
 
+def _copy_stream(raw, f):
+    """
+    Copies a response stream into f through one reused buffer (no per-chunk allocation).
+    Returns the number of bytes copied.
+    """
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    copied = 0
+    while True:
+        n = raw.readinto(view)
+        if not n:
+            break
+        f.write(view[:n])
+        copied += n
+    return copied
+
+def _download_range(url, save_path, start, end):
+    """
+    Downloads bytes start..end (inclusive) into the same offset of save_path.
+    A range the server ignores or cuts short is retried, then raises IOError,
+    so no zero-filled gap is left in the preallocated file.
+    """
+    expected = end - start + 1
+    for attempt in range(1, RANGE_ATTEMPTS + 1):
+        response = _SESSION.get(
+            url,
+            headers={"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"},
+            stream=True,
+            timeout=30
+        )
+        with response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request (HTTP {response.status_code})")
+            content_range = response.headers.get("Content-Range", "")
+            if not content_range.startswith(f"bytes {start}-{end}/"):
+                raise IOError(f"Server sent range '{content_range}' for bytes {start}-{end}")
+            
+            # Each worker has its own handle and disjoint range, so no locking
+            with open(save_path, 'r+b', buffering=COPY_BUFFER_SIZE) as f:
+                f.seek(start)
+                copied = _copy_stream(response.raw, f)
+        
+        if copied == expected:
+            return
+        logger.warning(
+            f"Range {start}-{end} returned {copied} of {expected} bytes "
+            f"(attempt {attempt}/{RANGE_ATTEMPTS})"
+        )
+    raise IOError(f"Range {start}-{end} came back incomplete")
+
+def _preallocate(f, size):
+    """
+    Sizes the file up front. On Linux the blocks are reserved in one go
+    (fewer extent updates while writing, less fragmentation).
+    """
+    if size <= 0:
+        return
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:
+            pass  # e.g. filesystem without fallocate support
+    f.truncate(size)
+
+def _download_serial(url, save_path, size=0):
+    response = _SESSION.get(url, stream=True)
+    response.raise_for_status()
+    response.raw.decode_content = True  # Undo any gzip transfer encoding
+    
+    with open(save_path, 'wb', buffering=COPY_BUFFER_SIZE) as f:
+        _preallocate(f, size)
+        _copy_stream(response.raw, f)
+        f.truncate()  # In case fewer bytes arrived than announced
+
+def _drop_page_cache(save_path):
+    """Hints the OS not to keep the written installer cached (Linux/POSIX only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(save_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+def _download(url, save_path):
+    """
+    Downloads url to save_path, in parallel ranges when the server allows it.
+    """
+    head = _SESSION.head(url, allow_redirects=True, timeout=10,
+                         headers={"Accept-Encoding": "identity"})
+    size = int(head.headers.get("Content-Length", 0))
+    
+    if not (head.ok and head.headers.get("Accept-Ranges") == "bytes" and size > DOWNLOAD_PART_SIZE):
+        _download_serial(url, save_path, size if head.ok else 0)
+        return
+    
+    # Pre-size the file so workers can write their ranges in any order
+    with open(save_path, 'wb') as f:
+        _preallocate(f, size)
+    
+    ranges = [
+        (start, min(start + DOWNLOAD_PART_SIZE, size) - 1)
+        for start in range(0, size, DOWNLOAD_PART_SIZE)
+    ]
+    # head.url is the final (redirected) asset URL
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(_download_range, head.url, save_path, start, end)
+            for start, end in ranges
+        ]
+        for future in futures:
+            future.result()
+
 def download_and_install_update(download_url, new_version):
     """
     Downloads the update and triggers the installer/executable.
     """
     try:
-        logger.info(f"⬇️ Downloading update from {download_url}...")
-        response = requests.get(download_url, stream=True)
-        response.raise_for_status()
-        
         filename = os.path.basename(download_url)
         save_path = os.path.join(TEMP_DIR, filename)
         
-        with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                
-        logger.info("✅ Download complete. Starting update...")
+        # The expected digest must come from the release, never from the download itself
+        state = _load_update_state()
+        expected_sha256 = None
+        if state.get("download_url") == download_url:
+            expected_sha256 = state.get("sha256")
+            if not expected_sha256 and state.get("sha256_url"):
+                expected_sha256 = _fetch_checksum(state["sha256_url"])
+        if not expected_sha256:
+            logger.error("❌ Release publishes no SHA-256 for this installer; refusing to install it.")
+            return False
+        
+        if os.path.exists(save_path) and _sha256_file(save_path) == expected_sha256:
+            logger.info("✅ Update already downloaded. Starting update...")
+        else:
+            logger.info(f"⬇️ Downloading update from {download_url}...")
+            _download(download_url, save_path)
+            
+            if _sha256_file(save_path) != expected_sha256:
+                os.remove(save_path)
+                raise IOError("Downloaded update failed its SHA-256 check")
+            # Only after hashing, which reads the file back from the cache
+            _drop_page_cache(save_path)
+            logger.info("✅ Download complete. Starting update...")
         
         if IS_WINDOWS:
             # In a real scenario, this would likely be an installer or a self-replacing exe.